@@ -19,6 +19,7 @@ from __future__ import annotations
 
 import json
 import logging
+import py_compile
 from pathlib import Path
 from typing import Any, Dict, Optional, TypedDict
 
@@ -216,6 +217,11 @@ def _update_registry_node(state: EvolutionState) -> EvolutionState:
             encoding="utf-8",
         )
 
+        # Pre-compile so registry loads hit the __pycache__ bytecode
+        tool_file = GENERATED_TOOLS_DIR / f"{tool_name}.py"
+        if tool_file.exists():
+            py_compile.compile(str(tool_file), doraise=False)
+
         state["registry_updated"] = True
         logger.info("Evolution: tool '%s' added to approved.json.", tool_name)
 
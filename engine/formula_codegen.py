@@ -0,0 +1,64 @@
+"""
+Formula specialisation for the deterministic scorer.
+
+Once the agent emits a FormulaSpec, its weights are fixed for as long as
+that market is watched.  compile_formula() turns those weights into a
+straight-line Python function (one multiply-add per selection, no loop,
+no lookups) and caches it, so every later scoring call with the same
+weights reuses the compiled code.
+
+The generated source contains nothing but float literals and indexing.
+NO LLM logic here. Pure arithmetic.
+"""
+
+from __future__ import annotations
+
+import functools
+import math
+import textwrap
+from typing import Callable, Dict, Sequence, Tuple
+
+from schemas import FormulaSpec
+
+# Beyond this many selections an unrolled expression buys nothing over a loop
+_MAX_UNROLLED_SELECTIONS = 32
+
+ScoreFn = Callable[[Sequence[float]], float]
+
+
+def compile_formula(spec: FormulaSpec) -> ScoreFn:
+    """
+    Return a function computing sum(weight_i * signal_i) for *spec*.
+
+    The returned callable takes one signal per selection, in selection
+    order, and sums the products left to right exactly like a plain loop.
+    """
+    return _compile_weights(tuple(s.weight for s in spec.selections))
+
+
+@functools.lru_cache(maxsize=256)
+def _compile_weights(weights: Tuple[float, ...]) -> ScoreFn:
+    """Generate (or fall back to) a scoring function for fixed weights."""
+    if (
+        not weights
+        or len(weights) > _MAX_UNROLLED_SELECTIONS
+        or not all(math.isfinite(w) for w in weights)
+    ):
+        return functools.partial(_weighted_sum, weights)
+
+    terms = " + ".join(f"{w!r} * s[{i}]" for i, w in enumerate(weights))
+    src = textwrap.dedent(f"""\
+        def _score(s):
+            return {terms}
+    """)
+    namespace: Dict[str, ScoreFn] = {}
+    exec(compile(src, "<formula>", "exec"), namespace)
+    return namespace["_score"]
+
+
+def _weighted_sum(weights: Tuple[float, ...], signals: Sequence[float]) -> float:
+    """Generic fallback used when unrolling is not worthwhile."""
+    total = 0.0
+    for w, s in zip(weights, signals):
+        total += w * s
+    return total
@@ -23,6 +23,7 @@ import logging
 import math
 from typing import List, Optional
 
+from engine.formula_codegen import compile_formula
 from schemas import FormulaSpec, ScoreResult, ToolOutput
 
 logger = logging.getLogger(__name__)
@@ -99,16 +100,13 @@ def _compute_signal_sum(
     Original weighted-sum mode (backward compatible).
     score = sum(weight_i * mean(output_vector_i))
     """
-    weights: List[float] = []
-    signals: List[float] = []
-
-    for output, selection in zip(tool_outputs, formula.selections):
-        vec = output.output_vector
-        signal = sum(vec) / len(vec) if vec else 0.0
-        weights.append(selection.weight)
-        signals.append(signal)
+    weights: List[float] = [s.weight for s in formula.selections]
+    signals: List[float] = [
+        sum(vec) / len(vec) if vec else 0.0
+        for vec in (o.output_vector for o in tool_outputs)
+    ]
 
-    final_score = round(sum(w * s for w, s in zip(weights, signals)), 6)
+    final_score = round(compile_formula(formula)(signals), 6)
     bet_triggered = final_score >= formula.threshold
 
     logger.info(
@@ -7,8 +7,12 @@ This module provides two interfaces:
      runs it, and writes a structured JSON result to stdout.
 
   2. run_tool_in_sandbox(tool_path, event_input) — called by the PARENT
-     process (tool_verifier.py Phase 2). It spawns the child, enforces a
-     hard timeout, captures stdout, and parses the JSON result.
+     process (tool_verifier.py Phases 2 and 3). It spawns the child, enforces
+     a hard timeout, captures stdout, and parses the JSON result.  With
+     repeat > 1 the child loads the tool once and calls run() that many
+     times, so a determinism check costs one spawn and one module compile;
+     the wall-clock and CPU budgets are scaled by repeat so each run()
+     still gets the single-run allowance.
 
 Security properties:
   - Tool code never executes in the main process.
@@ -33,7 +37,7 @@ import sys
 import tempfile
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
 
 logger = logging.getLogger(__name__)
 
@@ -58,10 +62,12 @@ class SandboxResult:
         stderr_text:    Raw stderr captured from the child process.
         exit_code:      OS exit code of the child process.
         duration_ms:    Wall-clock time of the child process in milliseconds.
+        output_vectors: One output vector per run() call, in call order
+                        (empty list on failure).
     """
 
     __slots__ = ("success", "output_vector", "error", "stderr_text",
-                 "exit_code", "duration_ms")
+                 "exit_code", "duration_ms", "output_vectors")
 
     def __init__(
         self,
@@ -71,6 +77,7 @@ class SandboxResult:
         stderr_text: str,
         exit_code: int,
         duration_ms: float,
+        output_vectors: Optional[List[list]] = None,
     ) -> None:
         self.success       = success
         self.output_vector = output_vector
@@ -78,6 +85,9 @@ class SandboxResult:
         self.stderr_text   = stderr_text
         self.exit_code     = exit_code
         self.duration_ms   = duration_ms
+        if output_vectors is None:
+            output_vectors = [output_vector] if output_vector else []
+        self.output_vectors = output_vectors
 
     def to_dict(self) -> Dict[str, Any]:
         return {
@@ -87,6 +97,7 @@ class SandboxResult:
             "stderr_text":   self.stderr_text,
             "exit_code":     self.exit_code,
             "duration_ms":   self.duration_ms,
+            "output_vectors": self.output_vectors,
         }
 
 
@@ -96,6 +107,7 @@ def run_tool_in_sandbox(
     tool_path: Path,
     event_input_dict: Dict[str, Any],
     timeout_sec: Optional[int] = None,
+    repeat: int = 1,
 ) -> SandboxResult:
     """
     Spawn an isolated subprocess, run the tool inside it, return structured result.
@@ -103,8 +115,11 @@ def run_tool_in_sandbox(
     Args:
         tool_path:        Absolute path to the generated .py tool file.
         event_input_dict: The EventInput as a plain dict (JSON-serialisable).
-        timeout_sec:      Hard wall-clock kill timeout for the child.
+        timeout_sec:      Hard wall-clock kill timeout per run() call; the
+                          child is killed after timeout_sec * repeat.
                           Defaults to TOOL_VERIFY_TIMEOUT_SEC from config.
+        repeat:           Number of run() calls on one tool instance inside
+                          the child; every output lands in output_vectors.
 
     Returns:
         SandboxResult with success/failure details.
@@ -132,6 +147,7 @@ def run_tool_in_sandbox(
             tool_path=tool_path,
             event_json_path=event_json_path,
             timeout_sec=timeout_sec,
+            repeat=repeat,
         )
     finally:
         try:
@@ -144,19 +160,24 @@ def _spawn_sandbox(
     tool_path: Path,
     event_json_path: str,
     timeout_sec: int,
+    repeat: int = 1,
 ) -> SandboxResult:
     """
     Low-level subprocess spawn + result parsing.
     """
     import time
 
-    # Build command: python -m prediction_agent.evolution.sandbox_runner <tool_path> <event_json>
+    # timeout_sec is a per-run budget; the child makes `repeat` run() calls
+    timeout_sec = timeout_sec * repeat
+
+    # Build command: python -m prediction_agent.evolution.sandbox_runner <tool_path> <event_json> <repeat>
     # We pass __file__ as the script so the child imports THIS module as __main__.
     cmd = [
         sys.executable,
         str(Path(__file__).resolve()),   # child calls _sandbox_worker_main()
         str(tool_path),
         event_json_path,
+        str(repeat),
     ]
 
     # Determine project root so child can set sys.path correctly
@@ -231,6 +252,7 @@ def _spawn_sandbox(
     # Validate expected fields
     status = result_json.get("status", "failure")
     output_vector = result_json.get("output_vector", [])
+    output_vectors = result_json.get("output_vectors", [output_vector])
     error_msg = result_json.get("error", None)
 
     if status != "success":
@@ -243,28 +265,39 @@ def _spawn_sandbox(
             duration_ms=duration_ms,
         )
 
-    # Validate output_vector
-    if not isinstance(output_vector, list) or not output_vector:
+    # Validate every run's output_vector
+    if not isinstance(output_vectors, list) or len(output_vectors) != repeat:
         return SandboxResult(
             success=False,
             output_vector=[],
-            error="output_vector missing or empty in sandbox result",
+            error=f"Expected {repeat} output vectors in sandbox result",
             stderr_text=raw_stderr,
             exit_code=exit_code,
             duration_ms=duration_ms,
         )
 
-    for i, val in enumerate(output_vector):
-        if not isinstance(val, (int, float)):
+    for vector in output_vectors:
+        if not isinstance(vector, list) or not vector:
             return SandboxResult(
                 success=False,
                 output_vector=[],
-                error=f"output_vector[{i}] is not numeric: {type(val).__name__}",
+                error="output_vector missing or empty in sandbox result",
                 stderr_text=raw_stderr,
                 exit_code=exit_code,
                 duration_ms=duration_ms,
             )
 
+        for i, val in enumerate(vector):
+            if not isinstance(val, (int, float)):
+                return SandboxResult(
+                    success=False,
+                    output_vector=[],
+                    error=f"output_vector[{i}] is not numeric: {type(val).__name__}",
+                    stderr_text=raw_stderr,
+                    exit_code=exit_code,
+                    duration_ms=duration_ms,
+                )
+
     logger.debug(
         "Sandbox OK: %s → output_vector=%s (%.1fms)",
         tool_path.name, output_vector, duration_ms,
@@ -272,11 +305,12 @@ def _spawn_sandbox(
 
     return SandboxResult(
         success=True,
-        output_vector=output_vector,
+        output_vector=output_vectors[0],
         error=None,
         stderr_text=raw_stderr,
         exit_code=exit_code,
         duration_ms=duration_ms,
+        output_vectors=output_vectors,
     )
 
 
@@ -294,15 +328,22 @@ def _sandbox_worker_main() -> None:
     """
     import importlib.util
 
-    if len(sys.argv) != 3:
-        _child_fail("Usage: sandbox_runner.py <tool_path> <event_json_path>")
+    if len(sys.argv) not in (3, 4):
+        _child_fail("Usage: sandbox_runner.py <tool_path> <event_json_path> [repeat]")
         return
 
     tool_path_str  = sys.argv[1]
     event_json_str = sys.argv[2]
+    try:
+        repeat = int(sys.argv[3]) if len(sys.argv) == 4 else 1
+    except ValueError:
+        repeat = 0
+    if repeat < 1:
+        _child_fail(f"Invalid repeat count: {sys.argv[3]}")
+        return
 
     # 1. Apply POSIX resource limits (best-effort; silently skip on Windows)
-    _apply_resource_limits()
+    _apply_resource_limits(repeat)
 
     # 2. Block network access by replacing socket.socket with a stub
     _disable_network()
@@ -379,37 +420,41 @@ def _sandbox_worker_main() -> None:
         _child_fail("No BaseTool subclass found in module")
         return
 
-    # 8. Instantiate and run
+    # 8. Instantiate once and run `repeat` times against the loaded module
+    outputs = []
     try:
         tool_instance = tool_class()
-        output = tool_instance.run(event)
+        for _ in range(repeat):
+            outputs.append(tool_instance.run(event))
     except Exception as exc:
         _child_fail(f"Tool.run() raised: {type(exc).__name__}: {exc}")
         return
 
-    # 9. Validate output (schemas.py lives at project root)
+    # 9. Validate outputs (schemas.py lives at project root)
     try:
         from schemas import ToolOutput
-        if not isinstance(output, ToolOutput):
-            _child_fail(f"Tool did not return ToolOutput, got {type(output).__name__}")
-            return
-        if not output.output_vector:
-            _child_fail("output_vector is empty")
-            return
-        for i, v in enumerate(output.output_vector):
-            if not isinstance(v, (int, float)):
-                _child_fail(f"output_vector[{i}] is not numeric: {type(v).__name__}")
+        for output in outputs:
+            if not isinstance(output, ToolOutput):
+                _child_fail(f"Tool did not return ToolOutput, got {type(output).__name__}")
+                return
+            if not output.output_vector:
+                _child_fail("output_vector is empty")
                 return
+            for i, v in enumerate(output.output_vector):
+                if not isinstance(v, (int, float)):
+                    _child_fail(f"output_vector[{i}] is not numeric: {type(v).__name__}")
+                    return
     except Exception as exc:
         _child_fail(f"Output validation failed: {exc}")
         return
 
     # 10. Success — write structured JSON to stdout
     result = {
-        "status":        "success",
-        "output_vector": output.output_vector,
-        "metadata":      output.metadata,
-        "error":         None,
+        "status":         "success",
+        "output_vector":  outputs[0].output_vector,
+        "output_vectors": [output.output_vector for output in outputs],
+        "metadata":       outputs[0].metadata,
+        "error":          None,
     }
     print(json.dumps(result), flush=True)
     sys.exit(_SANDBOX_EXIT_OK)
@@ -426,16 +471,18 @@ def _child_fail(reason: str) -> None:
     sys.exit(_SANDBOX_EXIT_ERR)
 
 
-def _apply_resource_limits() -> None:
+def _apply_resource_limits(repeat: int = 1) -> None:
     """
     Apply CPU and memory resource limits on POSIX systems.
+    The CPU limit is per run() call, scaled by *repeat*.
     Silently no-ops on Windows or if the module is unavailable.
     """
     try:
         import resource  # POSIX only
         # CPU time limit (seconds)
+        cpu_sec = _SANDBOX_MAX_CPU_SEC * repeat
         soft, hard = resource.getrlimit(resource.RLIMIT_CPU)
-        new_soft = min(_SANDBOX_MAX_CPU_SEC, hard) if hard > 0 else _SANDBOX_MAX_CPU_SEC
+        new_soft = min(cpu_sec, hard) if hard > 0 else cpu_sec
         resource.setrlimit(resource.RLIMIT_CPU, (new_soft, hard))
 
         # Memory (RSS) limit
@@ -15,9 +15,18 @@ from collections import Counter
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
+import numpy as np
+
 from config import EVOLUTION_GAP_THRESHOLD, EXECUTION_LOG_FILE
 from prediction_agent.evolution.schemas import GapReport
 
+try:  # optional accelerator; stdlib json parses bytes identically
+    import orjson
+
+    _loads = orjson.loads
+except ImportError:
+    _loads = json.loads
+
 logger = logging.getLogger(__name__)
 
 # Keywords that suggest implicit calculations in rationale text
@@ -36,6 +45,9 @@ _IMPLICIT_CALC_KEYWORDS = [
     "expected value",
 ]
 
+# All keywords in one alternation so each rationale is scanned once
+_IMPLICIT_CALC_RE = re.compile("|".join(map(re.escape, _IMPLICIT_CALC_KEYWORDS)))
+
 # Minimum runs required before analysis is meaningful
 _MIN_RUNS = 5
 
@@ -57,6 +69,18 @@ def analyze_gaps(
         The highest-priority GapReport, or None if no gap exceeds threshold.
     """
     target = log_path or EXECUTION_LOG_FILE
+
+    # Cheap upper bound first: too few lines means too few entries, so the
+    # common "not enough runs yet" case never parses any JSON.
+    max_entries = _count_lines(target)
+    if max_entries < min_runs:
+        logger.info(
+            "Gap analyzer: only %d runs logged (need %d). Skipping.",
+            max_entries,
+            min_runs,
+        )
+        return None
+
     entries = _load_entries(target)
 
     if len(entries) < min_runs:
@@ -119,14 +143,14 @@ def analyze_gaps(
 
 def _detect_low_confidence(entries: List[Dict[str, Any]]) -> Optional[GapReport]:
     """Find runs where final_score is within 0.05 of threshold."""
-    close_calls = 0
     total = len(entries)
-
-    for e in entries:
-        score = e.get("final_score", 0.0)
-        threshold = e.get("threshold", 0.5)
-        if abs(score - threshold) <= 0.05:
-            close_calls += 1
+    scores = np.fromiter(
+        (e.get("final_score", 0.0) for e in entries), dtype=np.float64, count=total,
+    )
+    thresholds = np.fromiter(
+        (e.get("threshold", 0.5) for e in entries), dtype=np.float64, count=total,
+    )
+    close_calls = int(np.count_nonzero(np.abs(scores - thresholds) <= 0.05))
 
     ratio = close_calls / total if total > 0 else 0.0
 
@@ -219,14 +243,14 @@ def _detect_implicit_calculations(entries: List[Dict[str, Any]]) -> Optional[Gap
         rationale = e.get("reasoning_segments", "").lower()
         if not rationale:
             continue
-        found_any = False
+        line_hits = Counter(_IMPLICIT_CALC_RE.findall(rationale))
+        if not line_hits:
+            continue
+        runs_with_hits += 1
+        # Keyword-list order keeps most_common() tie-breaking unchanged
         for kw in _IMPLICIT_CALC_KEYWORDS:
-            count = rationale.count(kw)
-            if count > 0:
-                keyword_hits[kw] += count
-                found_any = True
-        if found_any:
-            runs_with_hits += 1
+            if kw in line_hits:
+                keyword_hits[kw] += line_hits[kw]
 
     ratio = runs_with_hits / len(entries) if entries else 0.0
 
@@ -249,20 +273,34 @@ def _detect_implicit_calculations(entries: List[Dict[str, Any]]) -> Optional[Gap
 # Data loading
 # ------------------------------------------------------------------
 
+def _count_lines(path: Path) -> int:
+    """Count lines (including an unterminated last one) without decoding them."""
+    if not path.exists():
+        return 0
+
+    count = 0
+    last = b"\n"
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            count += chunk.count(b"\n")
+            last = chunk[-1:]
+    return count + (last != b"\n")
+
+
 def _load_entries(path: Path) -> List[Dict[str, Any]]:
     """Load all entries from execution_logs.jsonl."""
     if not path.exists():
         return []
 
     entries: List[Dict[str, Any]] = []
-    with open(path, "r", encoding="utf-8") as f:
+    with open(path, "rb") as f:
         for line in f:
             line = line.strip()
             if not line:
                 continue
             try:
-                entries.append(json.loads(line))
-            except json.JSONDecodeError:
+                entries.append(_loads(line))
+            except ValueError:  # JSONDecodeError (either parser) or bad UTF-8
                 continue
 
     return entries
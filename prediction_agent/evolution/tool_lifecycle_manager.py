@@ -9,6 +9,8 @@ from __future__ import annotations
 
 import json
 import logging
+import os
+import weakref
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Dict, List, Optional
@@ -19,19 +21,61 @@ from prediction_agent.evolution.schemas import ToolLifecycleRecord, ToolStatus
 logger = logging.getLogger(__name__)
 
 
+def _append_lines(path: Path, lines: List[str]) -> None:
+    """Append *lines* to *path* as JSONL and empty the list."""
+    if not lines:
+        return
+    # Opened per call rather than held: another manager may compact the
+    # file (os.replace) at any time, and a held handle would keep
+    # appending to the unlinked original.
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "a", encoding="utf-8") as f:
+        f.write("\n".join(lines) + "\n")
+    lines.clear()
+
+
+def _flush_abandoned(path: Path, lines: List[str]) -> None:
+    """Finalizer: persist usage still buffered when a manager is dropped."""
+    try:
+        _append_lines(path, lines)
+    except OSError as exc:
+        logger.warning("Lost %d buffered lifecycle records for %s: %s", len(lines), path, exc)
+
+
 class ToolLifecycleManager:
     """
     Tracks generated tool performance over time.
 
-    Persists data to a JSONL file. Each record represents the current
-    aggregate state for one tool.
+    Persists data to a JSONL file. Each line is the aggregate state of one
+    tool at the time it was written; when a tool appears more than once the
+    last line wins.  Provenance and status changes rewrite the file as a
+    compact snapshot (one line per tool, replaced atomically), while
+    record_usage() only appends the updated record.  Appended history is
+    folded back into a snapshot by the next such rewrite; loading never
+    writes, so read-only users cannot race other managers' appends.
+
+    Usage appends are buffered and written every *flush_every* calls (1
+    writes through immediately).  Call flush() or close(), or use the
+    manager as a context manager, when batching; anything still buffered
+    is also flushed when the manager is garbage-collected or the
+    interpreter exits.
     """
 
-    def __init__(self, lifecycle_path: Path | None = None) -> None:
+    def __init__(self, lifecycle_path: Path | None = None, flush_every: int = 1) -> None:
         self._path = lifecycle_path or TOOL_LIFECYCLE_FILE
         self._records: Dict[str, ToolLifecycleRecord] = {}
+        self._flush_every = max(1, flush_every)
+        self._pending: List[str] = []
+        # Must not reference self; _pending is only ever mutated in place
+        self._finalizer = weakref.finalize(self, _flush_abandoned, self._path, self._pending)
         self._load()
 
+    def __enter__(self) -> "ToolLifecycleManager":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
     # ------------------------------------------------------------------
     # Public API
     # ------------------------------------------------------------------
@@ -146,7 +190,9 @@ class ToolLifecycleManager:
         else:
             record.consecutive_underperformance = 0
 
-        self._save()
+        self._pending.append(record.model_dump_json())
+        if len(self._pending) >= self._flush_every:
+            self.flush()
 
     def check_deprecation(self, tool_name: str) -> bool:
         """
@@ -192,8 +238,16 @@ class ToolLifecycleManager:
     # Persistence
     # ------------------------------------------------------------------
 
+    def flush(self) -> None:
+        """Append buffered usage records to the lifecycle file."""
+        _append_lines(self._path, self._pending)
+
+    def close(self) -> None:
+        """Flush buffered usage records."""
+        self.flush()
+
     def _load(self) -> None:
-        """Load lifecycle records from JSONL."""
+        """Load lifecycle records from JSONL (last line per tool wins)."""
         if not self._path.exists():
             return
 
@@ -210,8 +264,12 @@ class ToolLifecycleManager:
                     continue
 
     def _save(self) -> None:
-        """Overwrite the lifecycle JSONL with current state."""
+        """Atomically replace the lifecycle JSONL with a snapshot of current state."""
+        # The snapshot already contains every buffered update
+        self._pending.clear()
+
         self._path.parent.mkdir(parents=True, exist_ok=True)
-        with open(self._path, "w", encoding="utf-8") as f:
-            for record in self._records.values():
-                f.write(json.dumps(record.model_dump(mode="json"), default=str) + "\n")
+        tmp_path = self._path.with_name(f"{self._path.name}.{os.getpid()}.tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.write("".join(record.model_dump_json() + "\n" for record in self._records.values()))
+        os.replace(tmp_path, self._path)
@@ -6,7 +6,8 @@ Phase 2: Runtime sandbox via isolated subprocess (sandbox_runner.py)
           — tool code NEVER executes in the main process.
           — communication is strictly JSON over stdout.
           — hard timeout, POSIX resource limits, network disabled.
-Phase 3: Determinism check (identical outputs across multiple sandbox runs)
+Phase 3: Determinism check (identical outputs across repeated sandbox runs,
+          including the Phase 2 run from a separate process)
 """
 
 from __future__ import annotations
@@ -37,6 +38,8 @@ _BLOCKED_IMPORTS = frozenset({
     "requests",
     "urllib",
     "random",
+    "secrets",
+    "builtins",
     "multiprocessing",
     "threading",
     "ctypes",
@@ -117,8 +120,12 @@ def verify_tool(tool_path: Path, spec: ToolSpec) -> VerificationResult:
     """
     checks: Dict[str, bool] = {}
 
+    # Read the file once: the parsed tree feeds Phase 1, the text feeds
+    # the review document written on approval.
+    source = tool_path.read_text(encoding="utf-8")
+
     # ── Phase 1: AST inspection ────────────────────────────────────────────────
-    ast_ok, ast_reason = _check_ast(tool_path)
+    ast_ok, ast_reason = _check_ast(source, tool_path)
     checks["ast_inspection"] = ast_ok
     if not ast_ok:
         logger.warning("Tool '%s' failed AST inspection: %s", spec.tool_name, ast_reason)
@@ -131,7 +138,7 @@ def verify_tool(tool_path: Path, spec: ToolSpec) -> VerificationResult:
     logger.info("Tool '%s' passed Phase 1 (AST).", spec.tool_name)
 
     # ── Phase 2: Subprocess sandbox runtime ───────────────────────────────────
-    sb_ok, sb_reason = _check_sandbox(tool_path, spec)
+    sb_ok, sb_reason, sb_output = _check_sandbox(tool_path, spec)
     checks["runtime_sandbox"] = sb_ok
     if not sb_ok:
         logger.warning("Tool '%s' failed subprocess sandbox: %s", spec.tool_name, sb_reason)
@@ -144,7 +151,7 @@ def verify_tool(tool_path: Path, spec: ToolSpec) -> VerificationResult:
     logger.info("Tool '%s' passed Phase 2 (subprocess sandbox).", spec.tool_name)
 
     # ── Phase 3: Determinism check ─────────────────────────────────────────────
-    det_ok, det_reason = _check_determinism(tool_path, TOOL_VERIFY_DETERMINISM_RUNS)
+    det_ok, det_reason = _check_determinism(tool_path, TOOL_VERIFY_DETERMINISM_RUNS, sb_output)
     checks["determinism"] = det_ok
     if not det_ok:
         logger.warning("Tool '%s' failed determinism check: %s", spec.tool_name, det_reason)
@@ -160,7 +167,7 @@ def verify_tool(tool_path: Path, spec: ToolSpec) -> VerificationResult:
     from config import EVOLUTION_REQUIRE_MANUAL_APPROVAL, GENERATED_TOOLS_DIR
 
     if EVOLUTION_REQUIRE_MANUAL_APPROVAL:
-        _write_pending(tool_path, spec, checks, GENERATED_TOOLS_DIR)
+        _write_pending(tool_path, source, spec, checks, GENERATED_TOOLS_DIR)
     else:
         logger.info("Tool '%s' auto-approved (manual approval disabled)", spec.tool_name)
 
@@ -174,47 +181,73 @@ def verify_tool(tool_path: Path, spec: ToolSpec) -> VerificationResult:
 
 # ── Phase 1: AST Inspection ────────────────────────────────────────────────────
 
-def _check_ast(tool_path: Path) -> Tuple[bool, str]:
-    """Parse the file and check for disallowed constructs. Returns (passed, reason)."""
+def _check_ast(source: str, tool_path: Path) -> Tuple[bool, str]:
+    """Parse *source* and check for disallowed constructs. Returns (passed, reason)."""
     try:
-        source = tool_path.read_text(encoding="utf-8")
         tree = ast.parse(source, filename=str(tool_path))
     except SyntaxError as exc:
         return False, f"Syntax error: {exc}"
+    return _inspect_tree(tree)
 
-    for node in ast.walk(tree):
-        if isinstance(node, ast.Import):
-            for alias in node.names:
-                top = alias.name.split(".")[0]
-                if top in _BLOCKED_IMPORTS:
-                    return False, f"Blocked import: {alias.name}"
-
-        elif isinstance(node, ast.ImportFrom):
-            if node.module:
-                top = node.module.split(".")[0]
-                if top in _BLOCKED_IMPORTS:
-                    return False, f"Blocked import-from: {node.module}"
-
-        elif isinstance(node, ast.Call):
-            func_name = _get_call_name(node)
-            if func_name in _BLOCKED_CALLS:
-                return False, f"Blocked call: {func_name}"
-
-            if isinstance(node.func, ast.Attribute):
-                if isinstance(node.func.value, ast.Name):
-                    pair = (node.func.value.id, node.func.attr)
-                    if pair in _BLOCKED_ATTR_CALLS:
-                        return False, f"Blocked attribute call: {node.func.value.id}.{node.func.attr}"
-                    if node.func.value.id in _BLOCKED_IMPORTS:
-                        return False, f"Blocked call on prohibited module: {node.func.value.id}.{node.func.attr}"
-
-        elif isinstance(node, ast.Attribute):
-            if node.attr in _BLOCKED_DUNDERS:
-                return False, f"Blocked dunder access: {node.attr}"
 
+def _inspect_tree(tree: ast.AST) -> Tuple[bool, str]:
+    """Check an already-parsed module for disallowed constructs."""
+    visitor = _SafetyVisitor()
+    visitor.visit(tree)
+    if visitor.violation is not None:
+        return False, visitor.violation
     return True, ""
 
 
+class _SafetyVisitor(ast.NodeVisitor):
+    """
+    Single pass over a module that records the first blocked construct.
+
+    Every check is a frozenset membership test; once a violation is found
+    the rest of the tree is skipped.
+    """
+
+    def __init__(self) -> None:
+        self.violation: Optional[str] = None
+
+    def visit(self, node: ast.AST) -> None:
+        if self.violation is None:
+            super().visit(node)
+
+    def visit_Import(self, node: ast.Import) -> None:
+        for alias in node.names:
+            if alias.name.split(".")[0] in _BLOCKED_IMPORTS:
+                self.violation = f"Blocked import: {alias.name}"
+                return
+
+    def visit_ImportFrom(self, node: ast.ImportFrom) -> None:
+        if node.module and node.module.split(".")[0] in _BLOCKED_IMPORTS:
+            self.violation = f"Blocked import-from: {node.module}"
+
+    def visit_Call(self, node: ast.Call) -> None:
+        func_name = _get_call_name(node)
+        if func_name in _BLOCKED_CALLS:
+            self.violation = f"Blocked call: {func_name}"
+            return
+
+        func = node.func
+        if isinstance(func, ast.Attribute) and isinstance(func.value, ast.Name):
+            if (func.value.id, func.attr) in _BLOCKED_ATTR_CALLS:
+                self.violation = f"Blocked attribute call: {func.value.id}.{func.attr}"
+                return
+            if func.value.id in _BLOCKED_IMPORTS:
+                self.violation = f"Blocked call on prohibited module: {func.value.id}.{func.attr}"
+                return
+
+        self.generic_visit(node)
+
+    def visit_Attribute(self, node: ast.Attribute) -> None:
+        if node.attr in _BLOCKED_DUNDERS:
+            self.violation = f"Blocked dunder access: {node.attr}"
+            return
+        self.generic_visit(node)
+
+
 def _get_call_name(node: ast.Call) -> str:
     if isinstance(node.func, ast.Name):
         return node.func.id
@@ -225,11 +258,11 @@ def _get_call_name(node: ast.Call) -> str:
 
 # ── Phase 2: Subprocess Sandbox ────────────────────────────────────────────────
 
-def _check_sandbox(tool_path: Path, spec: ToolSpec) -> Tuple[bool, str]:
+def _check_sandbox(tool_path: Path, spec: ToolSpec) -> Tuple[bool, str, List[float]]:
     """
     Run the tool inside an isolated subprocess.
     Tool code NEVER executes in the main process.
-    Returns (passed, reason).
+    Returns (passed, reason, output_vector).
     """
     event_dict = _SYNTHETIC_EVENT.model_dump(mode="json")
     result: SandboxResult = run_tool_in_sandbox(
@@ -240,31 +273,36 @@ def _check_sandbox(tool_path: Path, spec: ToolSpec) -> Tuple[bool, str]:
     if result.stderr_text:
         logger.debug("Sandbox stderr for '%s': %s", spec.tool_name, result.stderr_text[:500])
     if not result.success:
-        return False, result.error or "Unknown sandbox failure"
-    return True, ""
+        return False, result.error or "Unknown sandbox failure", []
+    return True, "", result.output_vector
 
 
 # ── Phase 3: Determinism Check ─────────────────────────────────────────────────
 
-def _check_determinism(tool_path: Path, num_runs: int) -> Tuple[bool, str]:
+def _check_determinism(
+    tool_path: Path,
+    num_runs: int,
+    reference: List[float],
+) -> Tuple[bool, str]:
     """
-    Run the tool num_runs times via subprocess sandbox and verify identical output.
+    Run the tool num_runs times and verify identical output.
+
+    All runs happen inside ONE sandbox subprocess, so the module is loaded
+    and compiled once.  *reference* is the Phase 2 output from a separate
+    process; comparing against it still catches per-process variation such
+    as hash randomisation or import-time state.
     """
     event_dict = _SYNTHETIC_EVENT.model_dump(mode="json")
-    outputs: List[List[float]] = []
-
-    for i in range(num_runs):
-        result = run_tool_in_sandbox(
-            tool_path=tool_path,
-            event_input_dict=event_dict,
-            timeout_sec=TOOL_VERIFY_TIMEOUT_SEC,
-        )
-        if not result.success:
-            return False, f"Run {i + 1} failed: {result.error}"
-        outputs.append(result.output_vector)
+    result = run_tool_in_sandbox(
+        tool_path=tool_path,
+        event_input_dict=event_dict,
+        timeout_sec=TOOL_VERIFY_TIMEOUT_SEC,
+        repeat=num_runs,
+    )
+    if not result.success:
+        return False, f"Repeated runs failed: {result.error}"
 
-    reference = outputs[0]
-    for i, output in enumerate(outputs[1:], start=2):
+    for i, output in enumerate(result.output_vectors, start=2):
         if output != reference:
             return False, (
                 f"Non-deterministic: run 1={reference}, run {i}={output}"
@@ -276,6 +314,7 @@ def _check_determinism(tool_path: Path, num_runs: int) -> Tuple[bool, str]:
 
 def _write_pending(
     tool_path: Path,
+    source: str,
     spec: ToolSpec,
     checks: Dict[str, bool],
     generated_tools_dir: Path,
@@ -288,7 +327,7 @@ def _write_pending(
     shutil.copy(tool_path, pending_path)
 
     review_path = pending_dir / f"{spec.tool_name}_REVIEW.md"
-    first_50 = "\n".join(tool_path.read_text(encoding="utf-8").splitlines()[:50]) if tool_path.exists() else "N/A"
+    first_50 = "\n".join(source.splitlines()[:50]) or "N/A"
     review_content = f"""# Manual Review Required: {spec.tool_name}
 
 ## Tool Specification
@@ -5,11 +5,15 @@ All data flowing through the system must conform to these Pydantic models.
 
 from __future__ import annotations
 
-from datetime import datetime, timezone
+from dataclasses import dataclass, field
+from datetime import datetime
 from enum import Enum
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
 
-from pydantic import BaseModel, Field, field_validator
+import numpy as np
+from pydantic import BaseModel, Field, TypeAdapter, field_validator
+
+from time_source import get_now_utc
 
 
 # ──────────────────────────────────────────────
@@ -23,7 +27,7 @@ class EventInput(BaseModel):
     market_title: str = Field(..., description="Human-readable market title")
     current_price: float = Field(..., ge=0.0, le=1.0, description="Current YES price (0-1)")
     timestamp: datetime = Field(
-        default_factory=lambda: datetime.now(timezone.utc),
+        default_factory=get_now_utc,
         description="UTC timestamp when price was captured",
     )
 
@@ -38,11 +42,21 @@ class EventInput(BaseModel):
 # ──────────────────────────────────────────────
 
 class ToolOutput(BaseModel):
-    """Result vector from a single deterministic tool."""
+    """
+    Result vector from a single deterministic tool.
+
+    output_vector stays a plain list for JSONL compatibility.
+    """
     tool_name: str
     output_vector: List[float] = Field(..., min_length=1)
     metadata: dict = Field(default_factory=dict)
 
+    @property
+    def vector_np(self) -> np.ndarray:
+        """output_vector as a fresh float64 array (not cached, so it always
+        reflects the current list)."""
+        return np.asarray(self.output_vector, dtype=np.float64)
+
 
 class ToolExecutionStatus(BaseModel):
     """Execution result tracking for tool runner validation."""
@@ -81,11 +95,10 @@ class FormulaSpec(BaseModel):
     @field_validator("selections")
     @classmethod
     def weights_must_sum_to_one(cls, v: List[ToolSelection]) -> List[ToolSelection]:
-        total = sum(s.weight for s in v)
-        if abs(total - 1.0) > 0.01:
-            # Auto-normalize
-            for s in v:
-                s.weight = s.weight / total
+        # Always normalize — a no-op (up to float rounding) when already summed to 1
+        inv = 1.0 / sum(s.weight for s in v)
+        for s in v:
+            s.weight *= inv
         return v
 
 
@@ -111,14 +124,28 @@ class ScoreResult(BaseModel):
 # Watcher State
 # ──────────────────────────────────────────────
 
-class WatcherTick(BaseModel):
-    """Single poll from the watcher loop."""
+@dataclass(slots=True)
+class WatcherTick:
+    """
+    Single poll from the watcher loop.
+
+    A slots dataclass rather than a BaseModel: it is built once per poll
+    from trusted values and never parsed from external input.  Pydantic
+    still validates it when nested inside PaperBet.
+    """
     market_id: str
     polled_price: float
     threshold: float
-    timestamp: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+    timestamp: datetime = field(default_factory=get_now_utc)
     triggered: bool = False
 
+    def model_dump(self, mode: str = "python") -> Dict[str, Any]:
+        """Dict form matching BaseModel.model_dump for the JSONL loggers."""
+        return _WATCHER_TICK_ADAPTER.dump_python(self, mode=mode)
+
+
+_WATCHER_TICK_ADAPTER = TypeAdapter(WatcherTick)
+
 
 # ──────────────────────────────────────────────
 # Paper Bet / Run Log
@@ -134,4 +161,4 @@ class PaperBet(BaseModel):
     bet_placed: bool = False
     bet_side: Optional[str] = None  # "YES" or "NO"
     bet_amount: float = 0.0
-    timestamp: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+    timestamp: datetime = Field(default_factory=get_now_utc)
@@ -1,5 +1,6 @@
 
 import json
+import os
 from datetime import datetime, timezone
 
 INPUT_FILE = "outputs/market_snapshots.jsonl"
@@ -28,9 +29,13 @@ def refresh_timestamps():
             
     print(f"Refreshed {count} records with timestamp: {now_iso}")
     
-    with open(OUTPUT_FILE, "w", encoding="utf-8") as f:
+    # Write a new file and swap it in: snapshot tools keep the old file
+    # memory-mapped, and truncating it in place would crash them (SIGBUS)
+    tmp_file = OUTPUT_FILE + ".tmp"
+    with open(tmp_file, "w", encoding="utf-8") as f:
         for line in refreshed_lines:
             f.write(line + "\n")
+    os.replace(tmp_file, OUTPUT_FILE)
             
     print(f"Wrote back to {OUTPUT_FILE}")
 
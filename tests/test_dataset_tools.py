@@ -70,6 +70,10 @@ def _build_mock_jsonl(path: Path) -> None:
             "open_interest": oi,
         })
 
+    _write_jsonl(path, rows)
+
+
+def _write_jsonl(path: Path, rows: list) -> None:
     with open(path, "w", encoding="utf-8") as fh:
         for row in rows:
             fh.write(json.dumps(row) + "\n")
@@ -78,13 +82,74 @@ def _build_mock_jsonl(path: Path) -> None:
 # ------------------------------------------------------------------ #
 # Fixtures
 # ------------------------------------------------------------------ #
-@pytest.fixture
-def mock_jsonl(tmp_path: Path) -> Path:
-    p = tmp_path / "market_snapshots.jsonl"
+# JSONL files are read-only for every test, so each is written once per
+# session rather than once per test.
+@pytest.fixture(scope="session")
+def mock_jsonl(tmp_path_factory) -> Path:
+    p = tmp_path_factory.mktemp("dst") / "market_snapshots.jsonl"
     _build_mock_jsonl(p)
     return p
 
 
+@pytest.fixture(scope="session")
+def noask_jsonl(tmp_path_factory) -> Path:
+    """Rows without yes_bid / yes_ask."""
+    p = tmp_path_factory.mktemp("missing") / "noask.jsonl"
+    _write_jsonl(p, [
+        {"timestamp": _ts(i), "market_id": "NB-001", "last_price": 0.5, "volume": 100}
+        for i in range(10, 0, -1)
+    ])
+    return p
+
+
+@pytest.fixture(scope="session")
+def noprice_jsonl(tmp_path_factory) -> Path:
+    """Rows without last_price or bid/ask."""
+    p = tmp_path_factory.mktemp("missing") / "noprice.jsonl"
+    _write_jsonl(p, [
+        {"timestamp": _ts(i), "market_id": "NP-001", "volume": 100}
+        for i in range(10, 0, -1)
+    ])
+    return p
+
+
+@pytest.fixture(scope="session")
+def noliq_jsonl(tmp_path_factory) -> Path:
+    """Rows without open_interest or volume."""
+    p = tmp_path_factory.mktemp("missing") / "noliq.jsonl"
+    _write_jsonl(p, [
+        {"timestamp": _ts(i), "market_id": "NL-001", "last_price": 0.5}
+        for i in range(10, 0, -1)
+    ])
+    return p
+
+
+@pytest.fixture(scope="session")
+def volonly_jsonl(tmp_path_factory) -> Path:
+    """Rows with volume but no open_interest."""
+    p = tmp_path_factory.mktemp("missing") / "volonly.jsonl"
+    _write_jsonl(p, [
+        {"timestamp": _ts(i), "market_id": "VO-001", "last_price": 0.5, "volume": 100 + i * 10}
+        for i in range(10, 0, -1)
+    ])
+    return p
+
+
+@pytest.fixture(scope="class")
+def spread_tool(mock_jsonl) -> SpreadCompressionTool:
+    return SpreadCompressionTool(jsonl_path=mock_jsonl)
+
+
+@pytest.fixture(scope="class")
+def jump_tool(mock_jsonl) -> PriceJumpDetectorTool:
+    return PriceJumpDetectorTool(jsonl_path=mock_jsonl)
+
+
+@pytest.fixture(scope="class")
+def liquidity_tool(mock_jsonl) -> LiquiditySpikeTool:
+    return LiquiditySpikeTool(jsonl_path=mock_jsonl)
+
+
 @pytest.fixture
 def event() -> EventInput:
     return EventInput(
@@ -110,60 +175,50 @@ def unknown_event() -> EventInput:
 # ================================================================== #
 class TestSpreadCompressionTool:
 
-    def test_vector_length(self, mock_jsonl, event):
-        tool = SpreadCompressionTool(jsonl_path=mock_jsonl)
-        result = tool.run(event, window_minutes=999_999)
+    def test_vector_length(self, spread_tool, event):
+        result = spread_tool.run(event, window_minutes=999_999)
         assert len(result.output_vector) == 4
 
-    def test_tool_name(self, mock_jsonl, event):
-        tool = SpreadCompressionTool(jsonl_path=mock_jsonl)
-        result = tool.run(event, window_minutes=999_999)
+    def test_tool_name(self, spread_tool, event):
+        result = spread_tool.run(event, window_minutes=999_999)
         assert result.tool_name == "spread_compression_tool"
 
-    def test_confidence_positive(self, mock_jsonl, event):
-        tool = SpreadCompressionTool(jsonl_path=mock_jsonl)
-        result = tool.run(event, window_minutes=999_999)
+    def test_confidence_positive(self, spread_tool, event):
+        result = spread_tool.run(event, window_minutes=999_999)
         assert result.metadata["confidence"] > 0
 
-    def test_confidence_value(self, mock_jsonl, event):
-        tool = SpreadCompressionTool(jsonl_path=mock_jsonl)
-        result = tool.run(event, window_minutes=999_999)
+    def test_confidence_value(self, spread_tool, event):
+        result = spread_tool.run(event, window_minutes=999_999)
         # 20 samples → min(1.0, 20/50) = 0.4
         assert result.metadata["confidence"] == pytest.approx(0.4, abs=0.01)
 
-    def test_sample_count(self, mock_jsonl, event):
-        tool = SpreadCompressionTool(jsonl_path=mock_jsonl)
-        result = tool.run(event, window_minutes=999_999)
+    def test_sample_count(self, spread_tool, event):
+        result = spread_tool.run(event, window_minutes=999_999)
         assert result.metadata["sample_count"] == 20
 
-    def test_deterministic(self, mock_jsonl, event):
-        tool = SpreadCompressionTool(jsonl_path=mock_jsonl)
-        r1 = tool.run(event, window_minutes=999_999)
-        r2 = tool.run(event, window_minutes=999_999)
+    def test_deterministic(self, spread_tool, event):
+        r1 = spread_tool.run(event, window_minutes=999_999)
+        r2 = spread_tool.run(event, window_minutes=999_999)
         assert r1.output_vector == r2.output_vector
 
-    def test_unknown_market_zeros(self, mock_jsonl, unknown_event):
-        tool = SpreadCompressionTool(jsonl_path=mock_jsonl)
-        result = tool.run(unknown_event)
+    def test_unknown_market_zeros(self, spread_tool, unknown_event):
+        result = spread_tool.run(unknown_event)
         assert result.output_vector == [0.0, 0.0, 0.0, 0.0]
         assert result.metadata["confidence"] == 0.0
 
-    def test_mean_spread_positive(self, mock_jsonl, event):
-        tool = SpreadCompressionTool(jsonl_path=mock_jsonl)
-        result = tool.run(event, window_minutes=999_999)
+    def test_mean_spread_positive(self, spread_tool, event):
+        result = spread_tool.run(event, window_minutes=999_999)
         assert result.output_vector[0] > 0, "Mean spread should be positive"
 
-    def test_compression_ratio_below_one(self, mock_jsonl, event):
+    def test_compression_ratio_below_one(self, spread_tool, event):
         """Spreads narrow → last < mean → ratio < 1."""
-        tool = SpreadCompressionTool(jsonl_path=mock_jsonl)
-        result = tool.run(event, window_minutes=999_999)
+        result = spread_tool.run(event, window_minutes=999_999)
         compression_ratio = result.output_vector[3]
         assert compression_ratio < 1.0, "Narrowing spreads should yield ratio < 1"
 
-    def test_spread_trend_negative(self, mock_jsonl, event):
+    def test_spread_trend_negative(self, spread_tool, event):
         """Spreads narrow → last − first < 0."""
-        tool = SpreadCompressionTool(jsonl_path=mock_jsonl)
-        result = tool.run(event, window_minutes=999_999)
+        result = spread_tool.run(event, window_minutes=999_999)
         spread_trend = result.output_vector[2]
         assert spread_trend < 0, "Narrowing spreads should give negative trend"
 
@@ -173,59 +228,49 @@ class TestSpreadCompressionTool:
 # ================================================================== #
 class TestPriceJumpDetectorTool:
 
-    def test_vector_length(self, mock_jsonl, event):
-        tool = PriceJumpDetectorTool(jsonl_path=mock_jsonl)
-        result = tool.run(event, window_minutes=999_999)
+    def test_vector_length(self, jump_tool, event):
+        result = jump_tool.run(event, window_minutes=999_999)
         assert len(result.output_vector) == 4
 
-    def test_tool_name(self, mock_jsonl, event):
-        tool = PriceJumpDetectorTool(jsonl_path=mock_jsonl)
-        result = tool.run(event, window_minutes=999_999)
+    def test_tool_name(self, jump_tool, event):
+        result = jump_tool.run(event, window_minutes=999_999)
         assert result.tool_name == "price_jump_detector_tool"
 
-    def test_confidence_positive(self, mock_jsonl, event):
-        tool = PriceJumpDetectorTool(jsonl_path=mock_jsonl)
-        result = tool.run(event, window_minutes=999_999)
+    def test_confidence_positive(self, jump_tool, event):
+        result = jump_tool.run(event, window_minutes=999_999)
         assert result.metadata["confidence"] > 0
 
-    def test_confidence_value(self, mock_jsonl, event):
-        tool = PriceJumpDetectorTool(jsonl_path=mock_jsonl)
-        result = tool.run(event, window_minutes=999_999)
+    def test_confidence_value(self, jump_tool, event):
+        result = jump_tool.run(event, window_minutes=999_999)
         assert result.metadata["confidence"] == pytest.approx(0.4, abs=0.01)
 
-    def test_deterministic(self, mock_jsonl, event):
-        tool = PriceJumpDetectorTool(jsonl_path=mock_jsonl)
-        r1 = tool.run(event, window_minutes=999_999)
-        r2 = tool.run(event, window_minutes=999_999)
+    def test_deterministic(self, jump_tool, event):
+        r1 = jump_tool.run(event, window_minutes=999_999)
+        r2 = jump_tool.run(event, window_minutes=999_999)
         assert r1.output_vector == r2.output_vector
 
-    def test_unknown_market_zeros(self, mock_jsonl, unknown_event):
-        tool = PriceJumpDetectorTool(jsonl_path=mock_jsonl)
-        result = tool.run(unknown_event)
+    def test_unknown_market_zeros(self, jump_tool, unknown_event):
+        result = jump_tool.run(unknown_event)
         assert result.output_vector == [0.0, 0.0, 0.0, 0.0]
 
-    def test_max_jump_detects_large_jump(self, mock_jsonl, event):
-        tool = PriceJumpDetectorTool(jsonl_path=mock_jsonl)
-        result = tool.run(event, window_minutes=999_999)
+    def test_max_jump_detects_large_jump(self, jump_tool, event):
+        result = jump_tool.run(event, window_minutes=999_999)
         max_jump = result.output_vector[0]
         # Row 10 has a jump of ~0.06 (0.49 → 0.55)
         assert max_jump > 0.05, "Should detect the injected large jump"
 
-    def test_jump_count_at_least_one(self, mock_jsonl, event):
-        tool = PriceJumpDetectorTool(jsonl_path=mock_jsonl)
-        result = tool.run(event, window_minutes=999_999)
+    def test_jump_count_at_least_one(self, jump_tool, event):
+        result = jump_tool.run(event, window_minutes=999_999)
         jump_count = result.output_vector[2]
         assert jump_count >= 1.0, "At least one jump > 0.05 was injected"
 
-    def test_jump_density_in_range(self, mock_jsonl, event):
-        tool = PriceJumpDetectorTool(jsonl_path=mock_jsonl)
-        result = tool.run(event, window_minutes=999_999)
+    def test_jump_density_in_range(self, jump_tool, event):
+        result = jump_tool.run(event, window_minutes=999_999)
         density = result.output_vector[3]
         assert 0.0 <= density <= 1.0
 
-    def test_mean_jump_positive(self, mock_jsonl, event):
-        tool = PriceJumpDetectorTool(jsonl_path=mock_jsonl)
-        result = tool.run(event, window_minutes=999_999)
+    def test_mean_jump_positive(self, jump_tool, event):
+        result = jump_tool.run(event, window_minutes=999_999)
         mean_jump = result.output_vector[1]
         assert mean_jump > 0, "Prices change, so mean jump must be > 0"
 
@@ -235,61 +280,51 @@ class TestPriceJumpDetectorTool:
 # ================================================================== #
 class TestLiquiditySpikeTool:
 
-    def test_vector_length(self, mock_jsonl, event):
-        tool = LiquiditySpikeTool(jsonl_path=mock_jsonl)
-        result = tool.run(event, window_minutes=999_999)
+    def test_vector_length(self, liquidity_tool, event):
+        result = liquidity_tool.run(event, window_minutes=999_999)
         assert len(result.output_vector) == 4
 
-    def test_tool_name(self, mock_jsonl, event):
-        tool = LiquiditySpikeTool(jsonl_path=mock_jsonl)
-        result = tool.run(event, window_minutes=999_999)
+    def test_tool_name(self, liquidity_tool, event):
+        result = liquidity_tool.run(event, window_minutes=999_999)
         assert result.tool_name == "liquidity_spike_tool"
 
-    def test_confidence_positive(self, mock_jsonl, event):
-        tool = LiquiditySpikeTool(jsonl_path=mock_jsonl)
-        result = tool.run(event, window_minutes=999_999)
+    def test_confidence_positive(self, liquidity_tool, event):
+        result = liquidity_tool.run(event, window_minutes=999_999)
         assert result.metadata["confidence"] > 0
 
-    def test_confidence_value(self, mock_jsonl, event):
-        tool = LiquiditySpikeTool(jsonl_path=mock_jsonl)
-        result = tool.run(event, window_minutes=999_999)
+    def test_confidence_value(self, liquidity_tool, event):
+        result = liquidity_tool.run(event, window_minutes=999_999)
         assert result.metadata["confidence"] == pytest.approx(0.4, abs=0.01)
 
-    def test_deterministic(self, mock_jsonl, event):
-        tool = LiquiditySpikeTool(jsonl_path=mock_jsonl)
-        r1 = tool.run(event, window_minutes=999_999)
-        r2 = tool.run(event, window_minutes=999_999)
+    def test_deterministic(self, liquidity_tool, event):
+        r1 = liquidity_tool.run(event, window_minutes=999_999)
+        r2 = liquidity_tool.run(event, window_minutes=999_999)
         assert r1.output_vector == r2.output_vector
 
-    def test_unknown_market_zeros(self, mock_jsonl, unknown_event):
-        tool = LiquiditySpikeTool(jsonl_path=mock_jsonl)
-        result = tool.run(unknown_event)
+    def test_unknown_market_zeros(self, liquidity_tool, unknown_event):
+        result = liquidity_tool.run(unknown_event)
         assert result.output_vector == [0.0, 0.0, 0.0, 0.0]
 
-    def test_mean_liquidity_correct(self, mock_jsonl, event):
-        tool = LiquiditySpikeTool(jsonl_path=mock_jsonl)
-        result = tool.run(event, window_minutes=999_999)
+    def test_mean_liquidity_correct(self, liquidity_tool, event):
+        result = liquidity_tool.run(event, window_minutes=999_999)
         mean_liq = result.output_vector[0]
         # OI: 100, 110, 120, …, 290 → mean = 195
         assert mean_liq == pytest.approx(195.0, abs=1.0)
 
-    def test_latest_vs_mean_ratio_above_one(self, mock_jsonl, event):
+    def test_latest_vs_mean_ratio_above_one(self, liquidity_tool, event):
         """Latest OI (290) > mean (195) → ratio > 1."""
-        tool = LiquiditySpikeTool(jsonl_path=mock_jsonl)
-        result = tool.run(event, window_minutes=999_999)
+        result = liquidity_tool.run(event, window_minutes=999_999)
         ratio = result.output_vector[2]
         assert ratio > 1.0
 
-    def test_zscore_latest_positive(self, mock_jsonl, event):
+    def test_zscore_latest_positive(self, liquidity_tool, event):
         """Latest OI is well above mean → positive z-score."""
-        tool = LiquiditySpikeTool(jsonl_path=mock_jsonl)
-        result = tool.run(event, window_minutes=999_999)
+        result = liquidity_tool.run(event, window_minutes=999_999)
         zscore = result.output_vector[3]
         assert zscore > 0
 
-    def test_std_liquidity_positive(self, mock_jsonl, event):
-        tool = LiquiditySpikeTool(jsonl_path=mock_jsonl)
-        result = tool.run(event, window_minutes=999_999)
+    def test_std_liquidity_positive(self, liquidity_tool, event):
+        result = liquidity_tool.run(event, window_minutes=999_999)
         std_liq = result.output_vector[1]
         assert std_liq > 0, "OI varies, so std should be > 0"
 
@@ -300,66 +335,30 @@ class TestLiquiditySpikeTool:
 class TestMissingFields:
     """Verify tools don't crash on rows with missing fields."""
 
-    def test_spread_tool_no_bid_ask(self, tmp_path):
+    def test_spread_tool_no_bid_ask(self, noask_jsonl):
         """Rows without yes_bid / yes_ask → spread extraction yields empty → zeros."""
-        p = tmp_path / "noask.jsonl"
-        rows = [
-            {"timestamp": _ts(i), "market_id": "NB-001", "last_price": 0.5, "volume": 100}
-            for i in range(10, 0, -1)
-        ]
-        with open(p, "w") as fh:
-            for r in rows:
-                fh.write(json.dumps(r) + "\n")
-
-        tool = SpreadCompressionTool(jsonl_path=p)
+        tool = SpreadCompressionTool(jsonl_path=noask_jsonl)
         event = EventInput(event_id="e", market_id="NB-001", market_title="m", current_price=0.5)
         result = tool.run(event, window_minutes=999_999)
         assert result.output_vector == [0.0, 0.0, 0.0, 0.0]
 
-    def test_jump_tool_no_price(self, tmp_path):
+    def test_jump_tool_no_price(self, noprice_jsonl):
         """Rows without last_price or bid/ask → prices empty → zeros."""
-        p = tmp_path / "noprice.jsonl"
-        rows = [
-            {"timestamp": _ts(i), "market_id": "NP-001", "volume": 100}
-            for i in range(10, 0, -1)
-        ]
-        with open(p, "w") as fh:
-            for r in rows:
-                fh.write(json.dumps(r) + "\n")
-
-        tool = PriceJumpDetectorTool(jsonl_path=p)
+        tool = PriceJumpDetectorTool(jsonl_path=noprice_jsonl)
         event = EventInput(event_id="e", market_id="NP-001", market_title="m", current_price=0.5)
         result = tool.run(event, window_minutes=999_999)
         assert result.output_vector == [0.0, 0.0, 0.0, 0.0]
 
-    def test_liquidity_tool_no_oi_no_volume(self, tmp_path):
+    def test_liquidity_tool_no_oi_no_volume(self, noliq_jsonl):
         """Rows without open_interest or volume → zeros."""
-        p = tmp_path / "noliq.jsonl"
-        rows = [
-            {"timestamp": _ts(i), "market_id": "NL-001", "last_price": 0.5}
-            for i in range(10, 0, -1)
-        ]
-        with open(p, "w") as fh:
-            for r in rows:
-                fh.write(json.dumps(r) + "\n")
-
-        tool = LiquiditySpikeTool(jsonl_path=p)
+        tool = LiquiditySpikeTool(jsonl_path=noliq_jsonl)
         event = EventInput(event_id="e", market_id="NL-001", market_title="m", current_price=0.5)
         result = tool.run(event, window_minutes=999_999)
         assert result.output_vector == [0.0, 0.0, 0.0, 0.0]
 
-    def test_liquidity_tool_falls_back_to_volume(self, tmp_path):
+    def test_liquidity_tool_falls_back_to_volume(self, volonly_jsonl):
         """When open_interest is absent, uses volume."""
-        p = tmp_path / "volonly.jsonl"
-        rows = [
-            {"timestamp": _ts(i), "market_id": "VO-001", "last_price": 0.5, "volume": 100 + i * 10}
-            for i in range(10, 0, -1)
-        ]
-        with open(p, "w") as fh:
-            for r in rows:
-                fh.write(json.dumps(r) + "\n")
-
-        tool = LiquiditySpikeTool(jsonl_path=p)
+        tool = LiquiditySpikeTool(jsonl_path=volonly_jsonl)
         event = EventInput(event_id="e", market_id="VO-001", market_title="m", current_price=0.5)
         result = tool.run(event, window_minutes=999_999)
         assert result.output_vector[0] > 0, "Should use volume as fallback"
@@ -7,11 +7,15 @@ Verifies:
   - load_approved_generated_tools with empty manifest loads nothing
   - load_approved_generated_tools with valid entry loads the tool
   - generated_tool_names property works
+  - Cached tool listings refresh after registration
+  - LazyTool entries match the tools they stand in for
+  - LazyTool reads name/description from module constants without importing
 """
 
 from __future__ import annotations
 
 import json
+import sys
 from pathlib import Path
 from textwrap import dedent
 
@@ -19,7 +23,7 @@ import pytest
 
 from prediction_agent.schemas import EventInput, ToolOutput
 from prediction_agent.tools.base_tool import BaseTool
-from prediction_agent.tools.registry import ToolRegistry
+from prediction_agent.tools.registry import _LAZY_SNAPSHOT_TOOLS, LazyTool, ToolRegistry
 
 
 class _FakeGeneratedTool(BaseTool):
@@ -72,6 +76,16 @@ class TestRegistryGeneratedTools:
         with pytest.raises(ValueError, match="conflicts"):
             registry.register_generated_tool(_FakeGeneratedTool())
 
+    def test_cached_listing_refreshes_on_register(self):
+        registry = ToolRegistry()
+        registry.register(_AnotherFakeTool())
+        assert registry.tool_names == ["another_fake_tool"]
+        assert registry.list_tools() is registry.list_tools()
+
+        registry.register_generated_tool(_FakeGeneratedTool())
+        assert registry.tool_names == ["another_fake_tool", "fake_generated_tool"]
+        assert [t["name"] for t in registry.list_tools()] == registry.tool_names
+
     def test_empty_manifest_loads_nothing(self, tmp_path: Path, monkeypatch):
         # Create empty approved.json
         gen_dir = tmp_path / "generated"
@@ -154,3 +168,49 @@ class TestRegistryGeneratedTools:
 
         assert "missing_tool" not in registry
         assert len(registry) == 0
+
+
+class TestLazyTool:
+
+    def test_lazy_snapshot_entries_match_tools(self):
+        for target in _LAZY_SNAPSHOT_TOOLS:
+            lazy = LazyTool(target)
+            assert lazy._tool is None
+            assert lazy.tool.name == lazy.name
+            assert lazy.tool.description == lazy.description
+            assert lazy.deterministic is True
+
+    def test_name_mismatch_raises(self, tmp_path: Path, monkeypatch):
+        (tmp_path / "lazy_mismatch_tool.py").write_text(dedent('''\
+            from prediction_agent.tools.base_tool import BaseTool
+            from prediction_agent.schemas import EventInput, ToolOutput
+
+            TOOL_NAME = "declared_name"
+            TOOL_DESCRIPTION = "Mismatch."
+
+            class MismatchTool(BaseTool):
+                @property
+                def name(self) -> str:
+                    return "actual_name"
+
+                @property
+                def description(self) -> str:
+                    return TOOL_DESCRIPTION
+
+                def run(self, event: EventInput, **kwargs) -> ToolOutput:
+                    return ToolOutput(tool_name=self.name, output_vector=[0.0])
+        '''), encoding="utf-8")
+        monkeypatch.syspath_prepend(str(tmp_path))
+
+        lazy = LazyTool("lazy_mismatch_tool:MismatchTool")
+        assert lazy.name == "declared_name"
+        assert "lazy_mismatch_tool" not in sys.modules
+        with pytest.raises(ValueError, match="resolved to"):
+            lazy.tool
+
+    def test_missing_constants_raise(self, tmp_path: Path, monkeypatch):
+        (tmp_path / "lazy_bare_tool.py").write_text("NAME = 'x'\n", encoding="utf-8")
+        monkeypatch.syspath_prepend(str(tmp_path))
+
+        with pytest.raises(ValueError, match="TOOL_NAME"):
+            LazyTool("lazy_bare_tool:BareTool")
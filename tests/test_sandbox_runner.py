@@ -4,6 +4,7 @@ Tests for the subprocess-based sandbox runner.
 Verifies:
   - A valid tool runs successfully and returns correct JSON structure
   - Timeout kills a hanging tool
+  - Repeated runs get the timeout once per run, not once in total
   - Malformed output is rejected
   - Network access raises PermissionError inside sandbox
   - os.system calls raise inside sandbox (module-level network block)
@@ -158,6 +159,27 @@ class TestSandboxRunnerFailures:
         assert result.success is False
         assert "timeout" in (result.error or "").lower() or result.exit_code != 0
 
+    def test_repeat_scales_timeout(self):
+        """Each of `repeat` runs gets the full per-run timeout."""
+        tool_code = """
+            import time
+            from tools.base_tool import BaseTool
+            from schemas import EventInput, ToolOutput
+
+            class SlowTool(BaseTool):
+                @property
+                def name(self): return "slow_tool"
+                @property
+                def description(self): return "sleeps under the per-run timeout"
+                def run(self, event: EventInput, **kwargs) -> ToolOutput:
+                    time.sleep(1.0)
+                    return ToolOutput(tool_name=self.name, output_vector=[0.0])
+        """
+        path = _write_tool(tool_code)
+        result = run_tool_in_sandbox(path, SYNTHETIC_EVENT, timeout_sec=2, repeat=3)
+        assert result.success is True, result.error
+        assert len(result.output_vectors) == 3
+
     def test_empty_output_vector_returns_failure(self):
         """A tool returning an empty output_vector must be rejected."""
         tool_code = """
@@ -9,11 +9,16 @@ Verifies:
   - zero-output when fewer than 3 rows
   - deterministic (same input → same output)
   - price rule: falls back to midpoint when last_price missing
+  - out-of-order rows are measured in timestamp order
+  - rows with array/object field values are skipped, not fatal
+  - cached snapshot columns are read-only
+  - a same-length in-place edit is not mistaken for an append
 """
 
 from __future__ import annotations
 
 import json
+import os
 import tempfile
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
@@ -21,6 +26,7 @@ from pathlib import Path
 import pytest
 
 from prediction_agent.schemas import EventInput
+from prediction_agent.tools._snapshot_helpers import load_market
 from prediction_agent.tools.snapshot_volatility_tool import SnapshotVolatilityTool
 
 
@@ -54,21 +60,21 @@ def _build_mock_jsonl(path: Path) -> None:
             fh.write(json.dumps(row) + "\n")
 
 
-@pytest.fixture
-def mock_jsonl(tmp_path: Path) -> Path:
-    """Create a temp JSONL with 10 mock rows and return path."""
-    p = tmp_path / "market_snapshots.jsonl"
+@pytest.fixture(scope="module")
+def mock_jsonl(tmp_path_factory) -> Path:
+    """Create a temp JSONL with 10 mock rows once per module and return path."""
+    p = tmp_path_factory.mktemp("snap") / "market_snapshots.jsonl"
     _build_mock_jsonl(p)
     return p
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def tool(mock_jsonl: Path) -> SnapshotVolatilityTool:
-    """Tool wired to the mock JSONL."""
+    """Tool wired to the mock JSONL (read-only, shared by the module)."""
     return SnapshotVolatilityTool(jsonl_path=mock_jsonl)
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def event() -> EventInput:
     """Minimal EventInput for TEST-MKT-001."""
     return EventInput(
@@ -224,6 +230,52 @@ class TestWindowFilter:
 class TestEdgeCases:
     """Edge cases and robustness."""
 
+    def test_out_of_order_rows_are_time_sorted(self, tmp_path: Path):
+        """Jumps are measured in timestamp order, not file order."""
+        p = tmp_path / "shuffled.jsonl"
+        # Chronologically 0.50 → 0.58 in 0.02 steps (no jumps); file order jumps
+        minutes_and_prices = [(6, 0.58), (14, 0.50), (8, 0.56), (12, 0.52), (10, 0.54)]
+        with open(p, "w") as fh:
+            for minutes_ago, price in minutes_and_prices:
+                fh.write(json.dumps({
+                    "timestamp": _make_timestamp(minutes_ago),
+                    "market_id": "ORD-001",
+                    "last_price": price,
+                }) + "\n")
+
+        tool = SnapshotVolatilityTool(jsonl_path=p)
+        event = EventInput(event_id="e", market_id="ORD-001", market_title="m", current_price=0.5)
+        result = tool.run(event)
+        assert result.metadata["sample_count"] == 5
+        assert result.output_vector[3] == 0.0  # jump_rate
+
+    def test_container_field_values_skipped(self, tmp_path: Path):
+        """A list/object where a number is expected does not break later rows."""
+        p = tmp_path / "nested.jsonl"
+        rows = [
+            {"timestamp": _make_timestamp(6), "market_id": "NEST-001", "last_price": [1]},
+            {"timestamp": _make_timestamp(5), "market_id": "NEST-001", "last_price": 0.50, "volume": {"a": 1}},
+            {"timestamp": _make_timestamp(4), "market_id": "NEST-001", "last_price": 0.52},
+            {"timestamp": _make_timestamp(3), "market_id": "NEST-001", "last_price": 0.54},
+        ]
+        with open(p, "w") as fh:
+            for r in rows:
+                fh.write(json.dumps(r) + "\n")
+
+        tool = SnapshotVolatilityTool(jsonl_path=p)
+        event = EventInput(event_id="e", market_id="NEST-001", market_title="m", current_price=0.5)
+        result = tool.run(event)
+        assert result.metadata["sample_count"] == 3
+        assert result.output_vector[1] == pytest.approx(0.04, abs=0.001)
+
+    def test_cached_columns_are_read_only(self, mock_jsonl: Path):
+        """Columns are shared across tools, so callers cannot modify them."""
+        market = load_market(mock_jsonl, "TEST-MKT-001", 120)
+        assert market.price.size > 0
+        with pytest.raises(ValueError):
+            market.price[0] = 99.0
+        assert load_market(mock_jsonl, "TEST-MKT-001", 120).price[0] != 99.0
+
     def test_missing_jsonl_file(self, tmp_path: Path):
         """Tool handles missing JSONL gracefully."""
         tool = SnapshotVolatilityTool(jsonl_path=tmp_path / "does_not_exist.jsonl")
@@ -257,3 +309,68 @@ class TestEdgeCases:
         result = tool.run(event)
         liquidity = result.output_vector[4]
         assert liquidity == pytest.approx(400.0, abs=1.0)  # mean(300, 400, 500)
+
+    def test_result_cache_invalidated_on_append(self, tmp_path: Path):
+        """Appending snapshots changes the file identity → fresh result."""
+        p = tmp_path / "grow.jsonl"
+        rows = [
+            {"timestamp": _make_timestamp(5), "market_id": "GROW-001", "last_price": 0.50, "volume": 100},
+            {"timestamp": _make_timestamp(4), "market_id": "GROW-001", "last_price": 0.52, "volume": 100},
+            {"timestamp": _make_timestamp(3), "market_id": "GROW-001", "last_price": 0.54, "volume": 100},
+        ]
+        with open(p, "w") as fh:
+            for r in rows:
+                fh.write(json.dumps(r) + "\n")
+
+        tool = SnapshotVolatilityTool(jsonl_path=p)
+        event = EventInput(event_id="e", market_id="GROW-001", market_title="m", current_price=0.5)
+        assert tool.run(event).metadata["sample_count"] == 3
+
+        with open(p, "a") as fh:
+            fh.write(json.dumps({"timestamp": _make_timestamp(2), "market_id": "GROW-001", "last_price": 0.70, "volume": 100}) + "\n")
+
+        result = tool.run(event)
+        assert result.metadata["sample_count"] == 4
+        assert result.output_vector[1] == pytest.approx(0.20, abs=0.001)
+
+    def test_same_length_edit_rebuilds_columns(self, tmp_path: Path):
+        """Rewriting rows in the middle without changing the size is a
+        rewrite, not an append: cached columns must be rebuilt."""
+        p = tmp_path / "edit.jsonl"
+        lines = [
+            json.dumps({"timestamp": _make_timestamp(60 - i), "market_id": "EDIT-001",
+                        "last_price": 0.50, "volume": 1})
+            for i in range(50)
+        ]
+        p.write_text("\n".join(lines) + "\n")
+        event = EventInput(event_id="e", market_id="EDIT-001", market_title="m", current_price=0.5)
+        assert SnapshotVolatilityTool(jsonl_path=p).run(event).output_vector[0] == 0.0
+
+        edited = [ln.replace('"last_price": 0.5,', '"last_price": 0.9,') if 10 <= i < 40 else ln
+                  for i, ln in enumerate(lines)]
+        p.write_text("\n".join(edited) + "\n")
+        st = p.stat()
+        os.utime(p, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+
+        result = SnapshotVolatilityTool(jsonl_path=p).run(event)
+        assert result.output_vector[0] > 0.0
+        assert result.output_vector[1] == pytest.approx(0.4, abs=0.001)
+
+    def test_unreadable_index_sidecar_ignored(self, tmp_path: Path):
+        """A corrupt .idx next to the JSONL is rebuilt, not trusted."""
+        p = tmp_path / "sidecar.jsonl"
+        rows = [
+            {"timestamp": _make_timestamp(5), "market_id": "SIDE-001", "last_price": 0.50, "volume": 100},
+            {"timestamp": _make_timestamp(4), "market_id": "SIDE-001", "last_price": 0.60, "volume": 100},
+            {"timestamp": _make_timestamp(3), "market_id": "SIDE-001", "last_price": 0.55, "volume": 100},
+        ]
+        with open(p, "w") as fh:
+            for r in rows:
+                fh.write(json.dumps(r) + "\n")
+        (tmp_path / "sidecar.idx").write_bytes(b"not an index")
+
+        tool = SnapshotVolatilityTool(jsonl_path=p)
+        event = EventInput(event_id="e", market_id="SIDE-001", market_title="m", current_price=0.5)
+        result = tool.run(event)
+        assert result.metadata["sample_count"] == 3
+        assert result.output_vector[1] == pytest.approx(0.10, abs=0.001)
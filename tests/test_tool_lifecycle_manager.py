@@ -6,10 +6,15 @@ Verifies:
   - Deprecation triggers after N consecutive underperforming runs
   - Deprecated status does not delete tool files
   - Active tools list excludes deprecated tools
+  - Batched usage writes persist on close
+  - Batched usage writes persist when the manager is dropped unclosed
+  - Loading never rewrites the file; a status change compacts it
+  - Usage recorded after another manager compacts the file is not lost
 """
 
 from __future__ import annotations
 
+import gc
 from pathlib import Path
 
 import pytest
@@ -96,3 +101,77 @@ class TestLifecycleManager:
     def test_unknown_tool_not_deprecated(self, tmp_path: Path):
         lm = ToolLifecycleManager(lifecycle_path=tmp_path / "lifecycle.jsonl")
         assert lm.check_deprecation("nonexistent_tool") is False
+
+    def test_batched_usage_persists_on_close(self, tmp_path: Path):
+        lifecycle_file = tmp_path / "lifecycle.jsonl"
+
+        with ToolLifecycleManager(lifecycle_path=lifecycle_file, flush_every=100) as lm:
+            for _ in range(10):
+                lm.record_usage("batched_tool", score_contribution=0.1, correct=True, latency_ms=5.0)
+            assert not lifecycle_file.exists()
+
+        record = ToolLifecycleManager(lifecycle_path=lifecycle_file).get_record("batched_tool")
+        assert record is not None
+        assert record.usage_count == 10
+
+    def test_batched_usage_persists_when_dropped(self, tmp_path: Path):
+        lifecycle_file = tmp_path / "lifecycle.jsonl"
+
+        lm = ToolLifecycleManager(lifecycle_path=lifecycle_file, flush_every=100)
+        for _ in range(3):
+            lm.record_usage("batched_tool", score_contribution=0.1, correct=True, latency_ms=5.0)
+        assert not lifecycle_file.exists()
+        del lm
+        gc.collect()
+
+        record = ToolLifecycleManager(lifecycle_path=lifecycle_file).get_record("batched_tool")
+        assert record is not None
+        assert record.usage_count == 3
+
+    def test_load_does_not_rewrite_file(self, tmp_path: Path):
+        lifecycle_file = tmp_path / "lifecycle.jsonl"
+
+        lm = ToolLifecycleManager(lifecycle_path=lifecycle_file)
+        for _ in range(5):
+            lm.record_usage("tool_a", score_contribution=0.2, correct=True, latency_ms=10.0)
+        lm.record_usage("tool_b", score_contribution=0.3, correct=False, latency_ms=20.0)
+        with open(lifecycle_file, "a", encoding="utf-8") as f:
+            f.write("not json\n")
+        before = lifecycle_file.read_bytes()
+
+        reloaded = ToolLifecycleManager(lifecycle_path=lifecycle_file)
+        assert lifecycle_file.read_bytes() == before
+        assert reloaded.get_record("tool_a").usage_count == 5
+        assert reloaded.get_record("tool_b").usage_count == 1
+
+    def test_status_change_compacts_history(self, tmp_path: Path):
+        lifecycle_file = tmp_path / "lifecycle.jsonl"
+
+        lm = ToolLifecycleManager(lifecycle_path=lifecycle_file)
+        lm.record_usage("tool_a", score_contribution=0.2, correct=True, latency_ms=10.0)
+        for _ in range(10):
+            lm.record_usage("bad_tool", score_contribution=-0.1, correct=False,
+                            latency_ms=10.0, underperformance_threshold=0.0)
+        assert len(lifecycle_file.read_text(encoding="utf-8").splitlines()) == 11
+
+        assert lm.check_deprecation("bad_tool") is True
+        assert len(lifecycle_file.read_text(encoding="utf-8").splitlines()) == 2
+
+    def test_usage_after_concurrent_compaction_persists(self, tmp_path: Path):
+        lifecycle_file = tmp_path / "lifecycle.jsonl"
+
+        writer = ToolLifecycleManager(lifecycle_path=lifecycle_file)
+        writer.record_usage("tool_a", score_contribution=0.2, correct=True, latency_ms=10.0)
+        writer.record_usage("tool_a", score_contribution=0.2, correct=True, latency_ms=10.0)
+
+        # A second manager's status change compacts the file (os.replace)
+        other = ToolLifecycleManager(lifecycle_path=lifecycle_file)
+        for _ in range(10):
+            other.record_usage("bad_tool", score_contribution=-0.1, correct=False,
+                               latency_ms=10.0, underperformance_threshold=0.0)
+        assert other.check_deprecation("bad_tool") is True
+        writer.record_usage("tool_a", score_contribution=0.2, correct=True, latency_ms=10.0)
+
+        reloaded = ToolLifecycleManager(lifecycle_path=lifecycle_file)
+        assert reloaded.get_record("tool_a").usage_count == 3
+        assert reloaded.get_record("bad_tool").status == ToolStatus.DEPRECATED
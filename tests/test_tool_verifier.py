@@ -150,6 +150,28 @@ class TestASTInspection:
         assert result.passed is False
         assert "eval" in result.rejection_reason
 
+    def test_blocks_builtins_import(self, tmp_path: Path):
+        code = dedent('''\
+            from builtins import eval as safe_eval
+            from tools.base_tool import BaseTool
+            from schemas import EventInput, ToolOutput
+
+            class BadTool(BaseTool):
+                @property
+                def name(self): return "bad_tool"
+                @property
+                def description(self): return "Bad."
+                def run(self, event, **kwargs):
+                    val = safe_eval("1 + 2")
+                    return ToolOutput(tool_name="bad_tool", output_vector=[float(val)])
+        ''')
+        tool_file = tmp_path / "bad_tool.py"
+        tool_file.write_text(code, encoding="utf-8")
+
+        result = verify_tool(tool_file, _default_spec("bad_tool"))
+        assert result.passed is False
+        assert "builtins" in result.rejection_reason
+
 
 class TestRuntimeSandbox:
 
@@ -219,3 +241,29 @@ class TestDeterminism:
         result = verify_tool(tool_file, _default_spec("det_tool"))
         assert result.passed is True
         assert result.checks["determinism"] is True
+
+    def test_stateful_tool_fails(self, tmp_path: Path):
+        code = dedent('''\
+            from tools.base_tool import BaseTool
+            from schemas import EventInput, ToolOutput
+
+            class CounterTool(BaseTool):
+                calls = 0
+                @property
+                def name(self): return "counter_tool"
+                @property
+                def description(self): return "Drifts between calls."
+                def run(self, event, **kwargs):
+                    CounterTool.calls += 1
+                    return ToolOutput(
+                        tool_name="counter_tool",
+                        output_vector=[float(CounterTool.calls)],
+                    )
+        ''')
+        tool_file = tmp_path / "counter_tool.py"
+        tool_file.write_text(code, encoding="utf-8")
+
+        result = verify_tool(tool_file, _default_spec("counter_tool"))
+        assert result.passed is False
+        assert result.checks["determinism"] is False
+        assert "Non-deterministic" in result.rejection_reason
@@ -0,0 +1,39 @@
+"""
+Cached UTC clock for schema default timestamps.
+
+EventInput, WatcherTick and PaperBet stamp themselves with the current
+UTC time whenever they are built without an explicit timestamp.  None of
+those records need sub-millisecond precision, so get_now_utc() hands out
+the same datetime for a short window instead of calling datetime.now()
+on every construction.
+"""
+
+from __future__ import annotations
+
+import time
+from datetime import datetime, timezone
+from typing import Optional, Tuple
+
+# Default reuse window for the cached datetime
+DEFAULT_RESOLUTION_MS = 50
+
+# (monotonic_ns when captured, datetime captured)
+_cached_now: Optional[Tuple[int, datetime]] = None
+
+
+def get_now_utc(resolution_ms: int = DEFAULT_RESOLUTION_MS) -> datetime:
+    """
+    Return the current UTC time, reusing the last value if it was captured
+    less than *resolution_ms* milliseconds ago.
+
+    Timestamps from this function are non-decreasing but not strictly
+    increasing: records built within the same window share a value.
+    """
+    global _cached_now
+    mono = time.monotonic_ns()
+    cached = _cached_now
+    if cached is not None and mono - cached[0] < resolution_ms * 1_000_000:
+        return cached[1]
+    now = datetime.now(timezone.utc)
+    _cached_now = (mono, now)
+    return now
@@ -1,18 +1,39 @@
-from .base_tool import BaseTool
-from .registry import ToolRegistry
-from .mock_tools import MockPriceSignal, MockRandomContext
-from .snapshot_volatility_tool import SnapshotVolatilityTool
-from .spread_compression_tool import SpreadCompressionTool
-from .price_jump_detector_tool import PriceJumpDetectorTool
-from .liquidity_spike_tool import LiquiditySpikeTool
-
-__all__ = [
-    "BaseTool",
-    "ToolRegistry",
-    "MockPriceSignal",
-    "MockRandomContext",
-    "SnapshotVolatilityTool",
-    "SpreadCompressionTool",
-    "PriceJumpDetectorTool",
-    "LiquiditySpikeTool",
-]
+"""
+Deterministic tool package.
+
+Public names are resolved lazily (PEP 562): importing ``tools`` or one of
+its submodules does not pull in every tool implementation and its
+dependencies until that name is actually used.
+"""
+
+from __future__ import annotations
+
+import importlib
+from typing import Any, List
+
+# Public name -> submodule that defines it
+_EXPORTS = {
+    "BaseTool": "base_tool",
+    "ToolRegistry": "registry",
+    "MockPriceSignal": "mock_tools",
+    "MockRandomContext": "mock_tools",
+    "SnapshotVolatilityTool": "snapshot_volatility_tool",
+    "SpreadCompressionTool": "spread_compression_tool",
+    "PriceJumpDetectorTool": "price_jump_detector_tool",
+    "LiquiditySpikeTool": "liquidity_spike_tool",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module_name}", __name__), name)
+    globals()[name] = value  # later lookups skip __getattr__
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(__all__))
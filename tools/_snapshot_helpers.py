@@ -1,8 +1,15 @@
 """
 Shared helpers for snapshot-based deterministic tools.
 =====================================================
-Common JSONL loading, timestamp parsing, price extraction, and spread
-extraction used by all dataset-only tools.
+Common JSONL loading, timestamp parsing, and the per-market columnar
+index used by all dataset-only tools.
+
+Each snapshot file gets a row-offset index (market_id -> byte spans of
+its rows), kept in memory and in a sidecar ``.idx`` file next to the
+JSONL so later processes skip the scan; appends only scan the new bytes.
+A market's rows are decoded once per file version into MarketArrays,
+NumPy columns sorted by timestamp, and each tool run only slices those
+columns to the requested window.
 
 This module is internal (prefixed with _) and not exported from the
 tools package.  Individual tools import what they need.
@@ -10,17 +17,73 @@ tools package.  Individual tools import what they need.
 
 from __future__ import annotations
 
+import functools
+import itertools
 import json
 import logging
+import mmap
+import os
+import time
+import zipfile
+import zlib
+from collections import OrderedDict
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, Union
+
+import numpy as np
+
+try:  # optional accelerator; stdlib json parses bytes identically
+    import orjson
+
+    _loads = orjson.loads
+except ImportError:
+    _loads = json.loads
+
+try:  # optional: on-demand parsing, materialises only the fields we read
+    import simdjson as _simdjson
+except ImportError:
+    _simdjson = None
 
 logger = logging.getLogger(__name__)
 
 # Default path to the snapshot JSONL file
 DEFAULT_JSONL = Path(__file__).resolve().parent.parent / "outputs" / "market_snapshots.jsonl"
 
+_TS_DTYPE = "datetime64[us]"
+_NS_PER_MINUTE = 60 * 1_000_000_000
+
+# Per-tool result cache sizing.  Results are also bucketed by wall-clock
+# time so rows ageing out of the window are dropped within a few seconds
+# even when the file itself has not changed.
+_RESULT_CACHE_SIZE = 1024
+_RESULT_TTL_SEC = 5
+
+# Number of snapshot files kept memory-mapped / indexed at once
+_MAPPED_FILES_MAX = 8
+
+# On-disk row-offset index written next to the snapshot file
+# (outputs/market_snapshots.jsonl -> outputs/market_snapshots.idx)
+_SIDECAR_SUFFIX = ".idx"
+
+# Row fields read from the JSONL, in decode order
+_FIELDS = (
+    "market_id",
+    "timestamp",
+    "last_price",
+    "yes_bid",
+    "yes_ask",
+    "open_interest",
+    "volume",
+)
+
+# Everything after market_id and timestamp is numeric
+_NUM_FIELDS = len(_FIELDS) - 2
+
+_Buffer = Union[bytes, mmap.mmap]
+_FileIdent = Tuple[int, int, int]
+
 
 # ------------------------------------------------------------------
 # Timestamp parsing
@@ -44,132 +107,662 @@ def parse_timestamp(raw: Any) -> Optional[datetime]:
         return None
 
 
+def _naive_utc_iso(raw: Any) -> str:
+    """
+    Normalise a raw timestamp into a naive-UTC ISO string that NumPy can
+    parse, or ``"NaT"`` if it is unusable.
+
+    Snapshot writers emit ``datetime.now(timezone.utc).isoformat()``, so
+    the common case is a plain suffix strip; other offsets go through
+    :func:`parse_timestamp` and are converted to UTC.
+    """
+    if isinstance(raw, str):
+        if raw.endswith("+00:00"):
+            return raw[:-6]
+        if raw.endswith("Z"):
+            return raw[:-1]
+        if len(raw) <= 19 or raw[-6] not in "+-":
+            return raw
+    dt = parse_timestamp(raw)
+    if dt is None:
+        return "NaT"
+    return dt.astimezone(timezone.utc).replace(tzinfo=None).isoformat()
+
+
+def _to_datetime64(raw_ts: List[str]) -> np.ndarray:
+    """Parse normalised timestamp strings into a ``datetime64[us]`` array."""
+    try:
+        return np.array(raw_ts, dtype=_TS_DTYPE)
+    except ValueError:
+        # At least one malformed value — fall back to per-element parsing
+        out = np.empty(len(raw_ts), dtype=_TS_DTYPE)
+        for i, raw in enumerate(raw_ts):
+            try:
+                out[i] = np.datetime64(raw, "us")
+            except ValueError:
+                out[i] = np.datetime64("NaT")
+        return out
+
+
+def _to_epoch_ns(ts_arr: np.ndarray) -> np.ndarray:
+    """Naive-UTC ``datetime64`` array → int64 nanoseconds since the epoch.
+    NaT maps to the int64 minimum."""
+    return ts_arr.astype("datetime64[ns]").view(np.int64)
+
+
 # ------------------------------------------------------------------
-# JSONL loading with market_id + window filtering
+# Fast fixed-shape ISO-8601 parsing
 # ------------------------------------------------------------------
-def load_rows(
-    jsonl_path: Path,
-    market_id: str,
-    window_minutes: int,
-) -> List[Dict[str, Any]]:
+# Supported shapes, keyed by string length → (has .ffffff, UTC suffix):
+#
+#     YYYY-MM-DDTHH:MM:SS[.ffffff][+00:00 | Z]
+#
+# i.e. what ``datetime.isoformat()`` produces for UTC values (with or
+# without the offset).  A space is accepted in place of ``T``.  Anything
+# else — other offsets, other fraction widths — takes the general path.
+_FAST_ISO_SHAPES = {
+    19: (False, b""),
+    20: (False, b"Z"),
+    25: (False, b"+00:00"),
+    26: (True, b""),
+    27: (True, b"Z"),
+    32: (True, b"+00:00"),
+}
+_NAT_NS = np.iinfo(np.int64).min
+_NS_PER_SECOND = 1_000_000_000
+_DAYS_IN_MONTH = np.array([0, 31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31], dtype=np.int64)
+_DIGIT_COLS = [0, 1, 2, 3, 5, 6, 8, 9, 11, 12, 14, 15, 17, 18]
+_FRAC_COLS = [20, 21, 22, 23, 24, 25]
+
+
+def _parse_fixed_iso(chars: np.ndarray, frac: bool, suffix: bytes) -> Tuple[np.ndarray, np.ndarray]:
     """
-    Read JSONL and return rows matching *market_id* within the last
-    *window_minutes*, sorted ascending by timestamp.
+    Parse an ``(n, L)`` uint8 matrix of same-shape timestamps.
 
-    Each returned row has an extra ``_parsed_ts`` key with the parsed
-    datetime object for downstream use.
+    Returns ``(epoch_ns, ok)``; rows where ``ok`` is False (bad digits,
+    separators, suffix or calendar values) must be parsed another way.
     """
-    if not jsonl_path.exists():
-        logger.warning("Snapshot file not found: %s", jsonl_path)
-        return []
+    # One contiguous row per character position; uint8 arithmetic wraps,
+    # so "c - '0' <= 9" is a complete digit test.
+    raw = np.ascontiguousarray(chars.T)
+    cols = raw - np.uint8(ord("0"))
+
+    def number(*positions: int) -> np.ndarray:
+        value = cols[positions[0]].astype(np.int32)
+        for p in positions[1:]:
+            value *= 10
+            value += cols[p]
+        return value
+
+    digit_cols = _DIGIT_COLS + _FRAC_COLS if frac else _DIGIT_COLS
+    ok = (cols[digit_cols] <= 9).all(axis=0)
+    ok &= (raw[4] == ord("-")) & (raw[7] == ord("-"))
+    ok &= (raw[10] == ord("T")) | (raw[10] == ord(" "))
+    ok &= (raw[13] == ord(":")) & (raw[16] == ord(":"))
+    if frac:
+        ok &= raw[19] == ord(".")
+    for pos, byte in enumerate(suffix, start=raw.shape[0] - len(suffix)):
+        ok &= raw[pos] == byte
+
+    year = number(0, 1, 2, 3)
+    month = number(5, 6)
+    day = number(8, 9)
+    hour = number(11, 12)
+    minute = number(14, 15)
+    second = number(17, 18)
+    micro = number(*_FRAC_COLS) if frac else 0
+
+    leap = (year % 4 == 0) & ((year % 100 != 0) | (year % 400 == 0))
+    month_ok = (month >= 1) & (month <= 12)
+    mdays = _DAYS_IN_MONTH[np.where(month_ok, month, 0)] + ((month == 2) & leap)
+    ok &= month_ok & (day >= 1) & (day <= mdays)
+    ok &= (hour < 24) & (minute < 60) & (second < 60)
+
+    # Days since 1970-01-01 (proleptic Gregorian, Hinnant's days_from_civil)
+    y = year - (month <= 2)
+    era = y // 400
+    yoe = y - era * 400
+    doy = (153 * np.where(month > 2, month - 3, month + 9) + 2) // 5 + day - 1
+    doe = yoe * 365 + yoe // 4 - yoe // 100 + doy
+    days = era * 146097 + doe - 719468
+
+    # Calendar fields fit in int32; widen only for the final sum
+    seconds = days.astype(np.int64) * 86400 + (hour * 3600 + minute * 60 + second)
+    return seconds * _NS_PER_SECOND + micro * 1000, ok
+
+
+def _parse_epoch_ns(raw_ts: List[Any]) -> np.ndarray:
+    """
+    Parse raw row timestamps into int64 epoch nanoseconds (UTC), with
+    :data:`_NAT_NS` for anything unusable.
+
+    Strings in one of the :data:`_FAST_ISO_SHAPES` are decoded in bulk by
+    :func:`_parse_fixed_iso`, a few vectorised integer ops per column,
+    instead of one ``fromisoformat``/datetime64 parse per row; the rest
+    go through :func:`_naive_utc_iso` and NumPy's parser.
+    """
+    n = len(raw_ts)
+    out = np.full(n, _NAT_NS, dtype=np.int64)
+    done = np.zeros(n, dtype=bool)
+    try:
+        lengths = np.fromiter(map(len, raw_ts), dtype=np.int64, count=n)
+    except TypeError:  # a null/numeric timestamp somewhere
+        lengths = np.fromiter(
+            (len(r) if isinstance(r, str) else -1 for r in raw_ts), dtype=np.int64, count=n
+        )
+
+    for length, (frac, suffix) in _FAST_ISO_SHAPES.items():
+        idx = np.flatnonzero(lengths == length)
+        if idx.size == 0:
+            continue
+        group = raw_ts if idx.size == n else [raw_ts[i] for i in idx]
+        try:
+            buf = "".join(group).encode("ascii")
+        except (TypeError, UnicodeEncodeError):  # non-string values, non-ASCII text
+            continue
+        chars = np.frombuffer(buf, dtype=np.uint8).reshape(idx.size, length)
+        ns, ok = _parse_fixed_iso(chars, frac, suffix)
+        out[idx[ok]] = ns[ok]
+        done[idx[ok]] = True
+
+    rest = np.flatnonzero(~done)
+    if rest.size:
+        out[rest] = _to_epoch_ns(_to_datetime64([_naive_utc_iso(raw_ts[i]) for i in rest]))
+    return out
+
+
+# ------------------------------------------------------------------
+# Columnar per-market data
+# ------------------------------------------------------------------
+@dataclass(frozen=True)
+class MarketArrays:
+    """
+    Snapshot history for one market as parallel NumPy columns, sorted
+    ascending by timestamp (ties keep file order).
+
+    Missing or non-numeric fields are NaN.  ``price`` already applies the
+    PRICE RULE and ``liquidity`` the open_interest-else-volume rule, so
+    tools never look at raw rows.
+    """
+    ts: np.ndarray          # int64 epoch nanoseconds (UTC)
+    price: np.ndarray       # last_price > midpoint(yes_bid, yes_ask) > NaN
+    bid: np.ndarray         # yes_bid
+    ask: np.ndarray         # yes_ask
+    liquidity: np.ndarray   # open_interest, else volume
+
+    def since(self, cutoff_ns: int) -> "MarketArrays":
+        """Rows with ``ts >= cutoff_ns`` (a view, not a copy)."""
+        i = int(np.searchsorted(self.ts, cutoff_ns, side="left"))
+        if i == 0:
+            return self
+        return MarketArrays(
+            ts=self.ts[i:],
+            price=self.price[i:],
+            bid=self.bid[i:],
+            ask=self.ask[i:],
+            liquidity=self.liquidity[i:],
+        )
+
+    def prices(self) -> np.ndarray:
+        """Usable prices, in time order."""
+        return self.price[~np.isnan(self.price)]
+
+    def spreads(self) -> np.ndarray:
+        """(yes_ask − yes_bid) for rows where both are numeric."""
+        both = ~(np.isnan(self.bid) | np.isnan(self.ask))
+        return self.ask[both] - self.bid[both]
+
+    def liquidity_values(self) -> np.ndarray:
+        """Liquidity readings for rows that have one."""
+        return self.liquidity[~np.isnan(self.liquidity)]
+
+
+_EMPTY_F8 = np.empty(0, dtype=np.float64)
+_EMPTY_F8.flags.writeable = False
+_EMPTY = MarketArrays(
+    ts=np.empty(0, dtype=np.int64),
+    price=_EMPTY_F8,
+    bid=_EMPTY_F8,
+    ask=_EMPTY_F8,
+    liquidity=_EMPTY_F8,
+)
+
+
+# ------------------------------------------------------------------
+# File access
+# ------------------------------------------------------------------
+def _file_ident(jsonl_path: Path) -> _FileIdent:
+    """(inode, mtime_ns, size) — changes on any rewrite or append."""
+    st = jsonl_path.stat()
+    return (st.st_ino, st.st_mtime_ns, st.st_size)
+
+
+# path -> (file identity, read-only mapping)
+_mapped_files: "OrderedDict[str, Tuple[_FileIdent, _Buffer]]" = OrderedDict()
+
+
+def _map_file(jsonl_path: Path) -> _Buffer:
+    """
+    Return a read-only memory map of *jsonl_path*.
+
+    The mapping is kept and reused across calls (and across tools reading
+    the same file) until the file's inode, mtime or size changes, so the
+    contents are scanned straight from the page cache without a per-call
+    ``read()`` copy.  Replaced mappings are closed when the last reference
+    to them goes away.
+
+    Writers must only append to a snapshot file or replace it whole
+    (write a new file, then ``os.replace``): truncating a mapped file in
+    place makes later reads of the mapping fault with SIGBUS.
+    """
+    key = str(jsonl_path)
+    ident = _file_ident(jsonl_path)
+    cached = _mapped_files.get(key)
+    if cached is not None and cached[0] == ident:
+        _mapped_files.move_to_end(key)
+        return cached[1]
+
+    buf: _Buffer
+    if ident[2] == 0:
+        buf = b""  # empty files cannot be mapped
+    else:
+        with open(jsonl_path, "rb") as fh:
+            buf = mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+    _mapped_files[key] = (ident, buf)
+    _mapped_files.move_to_end(key)
+    if len(_mapped_files) > _MAPPED_FILES_MAX:
+        _mapped_files.popitem(last=False)
+    return buf
 
-    now = datetime.now(timezone.utc)
-    cutoff_seconds = window_minutes * 60
-    matched: List[Dict[str, Any]] = []
 
-    with open(jsonl_path, "r", encoding="utf-8") as fh:
-        for line_num, raw_line in enumerate(fh, start=1):
-            raw_line = raw_line.strip()
-            if not raw_line:
-                continue
+def _field_decoder(
+    fields: Tuple[str, ...] = _FIELDS,
+) -> Callable[[bytes], Optional[Tuple[Any, ...]]]:
+    """
+    Return a function decoding one JSONL line into a tuple of the
+    *fields* values (None where absent), or None if the line is not a
+    JSON object.  Malformed JSON raises ``ValueError``.
+
+    With pysimdjson installed only those fields are materialised; other
+    keys in the row are never converted to Python objects.  Array and
+    object values come back as None (no field we read is a container).
+    """
+    if _simdjson is not None:
+        parser = _simdjson.Parser()
+        proxy_types = (_simdjson.Object, _simdjson.Array)
+
+        def decode_simd(line: bytes) -> Optional[Tuple[Any, ...]]:
+            # No proxy may outlive this call: the parser is reused, and
+            # parse() refuses to run while one is still alive
             try:
-                row = json.loads(raw_line)
-            except json.JSONDecodeError:
-                logger.debug("Skipping malformed JSON on line %d", line_num)
-                continue
+                doc = parser.parse(line)
+            except RuntimeError as exc:
+                raise ValueError(str(exc)) from exc
+            if not isinstance(doc, _simdjson.Object):
+                return None
+            values = [doc.get(f) for f in fields]
+            return tuple([None if isinstance(v, proxy_types) else v for v in values])
+
+        return decode_simd
 
-            if row.get("market_id") != market_id:
-                continue
+    def decode(line: bytes) -> Optional[Tuple[Any, ...]]:
+        row = _loads(line)
+        if not isinstance(row, dict):
+            return None
+        get = row.get
+        return tuple([get(f) for f in fields])
 
-            ts = parse_timestamp(row.get("timestamp"))
-            if ts is None:
-                continue
+    return decode
 
-            age_seconds = (now - ts).total_seconds()
-            if age_seconds > cutoff_seconds:
-                continue
 
-            row["_parsed_ts"] = ts
-            matched.append(row)
+def _as_float(value: Any) -> float:
+    """float(value) for JSON numbers, NaN for anything else."""
+    if isinstance(value, (int, float)):
+        return float(value)
+    return np.nan
 
-    matched.sort(key=lambda r: r["_parsed_ts"])
-    return matched
+
+_NUMERIC_OR_NULL = frozenset({int, float, bool, type(None)})
+
+
+def _coerce_floats(values: List[Any]) -> np.ndarray:
+    """
+    float64 array of *values*: JSON numbers as floats, anything else NaN.
+
+    The usual all-numeric/null case is a single ``np.array`` call (None
+    becomes NaN); only lists containing strings or nested JSON values are
+    converted item by item.
+    """
+    if _NUMERIC_OR_NULL.issuperset(map(type, values)):
+        return np.array(values, dtype=np.float64)
+    return np.fromiter(map(_as_float, values), dtype=np.float64, count=len(values))
 
 
 # ------------------------------------------------------------------
-# Price extraction  (PRICE RULE)
+# Row-offset index (in memory + on-disk sidecar)
 # ------------------------------------------------------------------
-def row_price(row: Dict[str, Any]) -> Optional[float]:
+@dataclass
+class _OffsetIndex:
+    """
+    Byte spans of every complete row in one snapshot file, grouped by
+    market_id, plus the per-market columns built from them so far.
+
+    Rows after ``scanned`` (an unterminated last line) are not indexed;
+    they are decoded on demand when a market is built.
+    """
+    ident: _FileIdent
+    scanned: int                      # offset just past the last newline
+    prefix_crc: int                   # crc32 of the indexed bytes [0, scanned)
+    spans: Dict[str, np.ndarray]      # market_id -> (k, 2) int64 [start, end)
+    markets: Dict[str, MarketArrays] = field(default_factory=dict)
+
+
+def _crc32(buf: _Buffer, start: int, stop: int, value: int = 0) -> int:
+    """crc32 of ``buf[start:stop]`` continuing from *value*, without copying
+    the mapped bytes.  Used to tell an append (every indexed byte
+    unchanged) from an in-place edit or rewrite of the same file."""
+    with memoryview(buf) as view:
+        return zlib.crc32(view[start:stop], value)
+
+
+def _scan_spans(buf: _Buffer, start: int, stop: int) -> Dict[str, List[int]]:
     """
-    Return usable price for a single row, or None.
+    Record ``[start, end)`` of every row in ``buf[start:stop]`` under its
+    market_id, as a flat ``[s0, e0, s1, e1, ...]`` list per market.  Only
+    market_id is decoded here; malformed rows are skipped.
+    """
+    decode = _field_decoder(("market_id",))
+    spans: Dict[str, List[int]] = {}
+    find = buf.find
+    pos = start
+    while pos < stop:
+        nl = find(b"\n", pos, stop)
+        end = stop if nl == -1 else nl
+        line = buf[pos:end].strip()
+        if line:
+            try:
+                fields = decode(line)
+            except ValueError:  # every backend's decode error subclasses ValueError
+                logger.debug("Skipping malformed JSON at byte %d", pos)
+                fields = None
+            if fields is not None and isinstance(fields[0], str):
+                spans.setdefault(fields[0], []).extend((pos, end))
+        pos = end + 1
+    return spans
+
+
+def _merge_spans(
+    base: Dict[str, np.ndarray],
+    new: Dict[str, List[int]],
+) -> Dict[str, np.ndarray]:
+    """Append freshly scanned spans to an existing market -> spans map."""
+    merged = dict(base)
+    for mid, flat in new.items():
+        arr = np.array(flat, dtype=np.int64).reshape(-1, 2)
+        old = merged.get(mid)
+        merged[mid] = arr if old is None else np.concatenate((old, arr))
+    return merged
+
+
+def _sidecar_path(jsonl_path: Path) -> Path:
+    return jsonl_path.with_suffix(_SIDECAR_SUFFIX)
+
+
+def _read_sidecar(jsonl_path: Path) -> Optional[_OffsetIndex]:
+    """Load a previously written offset index, or None if absent/unreadable."""
+    path = _sidecar_path(jsonl_path)
+    try:
+        with open(path, "rb") as fh, np.load(fh, allow_pickle=False) as data:
+            meta = data["meta"]
+            markets = data["markets"].tolist()
+            counts = data["counts"]
+            spans = data["spans"]
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError, KeyError, zipfile.BadZipFile) as exc:
+        logger.debug("Ignoring unreadable snapshot index %s: %s", path, exc)
+        return None
+
+    if meta.shape != (5,):  # written by an older layout
+        logger.debug("Ignoring outdated snapshot index %s", path)
+        return None
+
+    bounds = np.cumsum(counts)[:-1]
+    return _OffsetIndex(
+        ident=(int(meta[0]), int(meta[1]), int(meta[2])),
+        scanned=int(meta[3]),
+        prefix_crc=int(meta[4]),
+        spans=dict(zip(markets, np.split(spans, bounds))),
+    )
 
-    Priority: last_price > midpoint(yes_bid, yes_ask) > skip.
+
+def _write_sidecar(jsonl_path: Path, index: _OffsetIndex) -> None:
+    """Persist *index* next to the snapshot file (atomic replace).  Failure
+    only costs a rescan in the next process, so it is logged, not raised."""
+    path = _sidecar_path(jsonl_path)
+    markets = list(index.spans)
+    meta = np.array([*index.ident, index.scanned, index.prefix_crc], dtype=np.int64)
+    counts = np.array([len(index.spans[m]) for m in markets], dtype=np.int64)
+    spans = (
+        np.concatenate([index.spans[m] for m in markets])
+        if markets
+        else np.empty((0, 2), dtype=np.int64)
+    )
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    try:
+        with open(tmp, "wb") as fh:
+            np.savez(
+                fh,
+                meta=meta,
+                markets=np.array(markets, dtype=str),
+                counts=counts,
+                spans=spans,
+            )
+        os.replace(tmp, path)
+    except OSError as exc:
+        logger.debug("Could not write snapshot index %s: %s", path, exc)
+
+
+def _scan_index(buf: _Buffer, ident: _FileIdent, base: Optional[_OffsetIndex]) -> _OffsetIndex:
     """
-    lp = row.get("last_price")
-    if lp is not None and isinstance(lp, (int, float)) and lp > 0:
-        return float(lp)
+    Bring an offset index up to date with *buf*.
 
-    bid = row.get("yes_bid")
-    ask = row.get("yes_ask")
+    If *base* covers a prefix of the current file (same inode, the file
+    strictly grew, and every byte *base* indexed is unchanged) only the
+    appended bytes are scanned, and only markets that received rows lose
+    their built columns.  Anything else (a rewrite, a truncation, an
+    in-place edit) rescans the whole file and drops every built column.
+    """
+    stop = buf.rfind(b"\n") + 1
     if (
-        bid is not None
-        and ask is not None
-        and isinstance(bid, (int, float))
-        and isinstance(ask, (int, float))
-        and (bid > 0 or ask > 0)
+        base is not None
+        and base.ident[0] == ident[0]
+        and base.ident[2] < ident[2]
+        and base.scanned <= stop
+        and _crc32(buf, 0, base.scanned) == base.prefix_crc
     ):
-        return (float(bid) + float(ask)) / 2.0
+        new = _scan_spans(buf, base.scanned, stop)
+        had_tail = base.ident[2] > base.scanned  # its unterminated row may have changed
+        markets = {} if had_tail else {m: a for m, a in base.markets.items() if m not in new}
+        return _OffsetIndex(
+            ident=ident,
+            scanned=stop,
+            prefix_crc=_crc32(buf, base.scanned, stop, base.prefix_crc),
+            spans=_merge_spans(base.spans, new),
+            markets=markets,
+        )
 
-    return None
+    return _OffsetIndex(
+        ident=ident,
+        scanned=stop,
+        prefix_crc=_crc32(buf, 0, stop),
+        spans=_merge_spans({}, _scan_spans(buf, 0, stop)),
+    )
 
 
-def extract_prices(rows: List[Dict[str, Any]]) -> List[float]:
-    """Extract price series from rows using the standard price rule."""
-    prices: List[float] = []
-    for r in rows:
-        p = row_price(r)
-        if p is not None:
-            prices.append(p)
-    return prices
+# path -> offset index for the file's current identity
+_offset_indexes: "OrderedDict[str, _OffsetIndex]" = OrderedDict()
+
+
+def _load_offset_index(jsonl_path: Path, buf: _Buffer, ident: _FileIdent) -> _OffsetIndex:
+    """
+    Return the offset index for *jsonl_path*: from memory if the file is
+    unchanged, else from the on-disk sidecar (extended if the file has
+    grown), else by scanning.  Any rescan is written back to the sidecar.
+    """
+    key = str(jsonl_path)
+    base = _offset_indexes.get(key)
+    if base is None or base.ident != ident:
+        if base is None:
+            base = _read_sidecar(jsonl_path)
+        if base is None or base.ident != ident:
+            base = _scan_index(buf, ident, base)
+            _write_sidecar(jsonl_path, base)
+    _offset_indexes[key] = base
+    _offset_indexes.move_to_end(key)
+    if len(_offset_indexes) > _MAPPED_FILES_MAX:
+        _offset_indexes.popitem(last=False)
+    return base
 
 
 # ------------------------------------------------------------------
-# Spread extraction
+# Per-market columns
 # ------------------------------------------------------------------
-def extract_spreads(rows: List[Dict[str, Any]]) -> List[float]:
+def _build_market(lines: Iterable[bytes], market_id: str) -> MarketArrays:
+    """Decode *market_id*'s rows and build its sorted columns."""
+    decode = _field_decoder()
+    raw_ts: List[Any] = []
+    # Raw numeric fields, row-major, _NUM_FIELDS per row; coerced in bulk
+    nums: List[Any] = []
+
+    for line in lines:
+        try:
+            # Every decoder skips surrounding JSON whitespace (incl. CRLF)
+            fields = decode(line)
+        except ValueError:
+            continue
+        if fields is None or fields[0] != market_id:
+            continue
+        raw_ts.append(fields[1])
+        nums.extend(fields[2:])
+
+    if not raw_ts:
+        return _EMPTY
+
+    ts_arr = _parse_epoch_ns(raw_ts)
+    lp_arr, bid_arr, ask_arr, oi_arr, vol_arr = np.ascontiguousarray(
+        _coerce_floats(nums).reshape(-1, _NUM_FIELDS).T
+    )
+
+    # PRICE RULE: last_price if > 0, else midpoint if either side > 0.
+    # NaN compares False, so missing fields fall through naturally.
+    has_mid = ~(np.isnan(bid_arr) | np.isnan(ask_arr)) & ((bid_arr > 0) | (ask_arr > 0))
+    price_arr = np.where(
+        lp_arr > 0,
+        lp_arr,
+        np.where(has_mid, (bid_arr + ask_arr) / 2.0, np.nan),
+    )
+    liq_arr = np.where(np.isnan(oi_arr), vol_arr, oi_arr)
+
+    idx = np.flatnonzero(ts_arr != _NAT_NS)  # unparseable timestamps never match a window
+    ts_valid = ts_arr[idx]
+    # Append-only files are normally in time order already; only sort if not
+    if np.any(ts_valid[1:] < ts_valid[:-1]):
+        idx = idx[np.argsort(ts_valid, kind="stable")]
+    columns = [arr[idx] for arr in (ts_arr, price_arr, bid_arr, ask_arr, liq_arr)]
+    # Cached and shared by every tool; views taken from these stay read-only
+    for col in columns:
+        col.flags.writeable = False
+    return MarketArrays(*columns)
+
+
+def _market_arrays(jsonl_path: Path, market_id: str) -> MarketArrays:
+    """Full (unwindowed) columns for *market_id*, built once per file
+    version from just that market's rows."""
+    ident = _file_ident(jsonl_path)
+    buf = _map_file(jsonl_path)
+    index = _load_offset_index(jsonl_path, buf, ident)
+
+    arrays = index.markets.get(market_id)
+    if arrays is None:
+        spans = index.spans.get(market_id)
+        lines: Iterable[bytes] = (
+            [buf[s:e] for s, e in spans.tolist()] if spans is not None else []
+        )
+        if index.scanned < len(buf):  # unterminated last row, not indexed
+            lines = itertools.chain(lines, (buf[index.scanned:],))
+        arrays = _build_market(lines, market_id)
+        index.markets[market_id] = arrays
+    return arrays
+
+
+def load_market(
+    jsonl_path: Path,
+    market_id: str,
+    window_minutes: int,
+) -> MarketArrays:
     """
-    Extract (yes_ask − yes_bid) for each row where both fields exist
-    and are numeric.
+    Return *market_id*'s snapshot columns from the last *window_minutes*,
+    sorted ascending by timestamp.  Empty columns if the file or market
+    is missing.
+
+    The returned arrays are views into a shared cache and must not be
+    modified.
     """
-    spreads: List[float] = []
-    for row in rows:
-        bid = row.get("yes_bid")
-        ask = row.get("yes_ask")
-        if (
-            bid is not None
-            and ask is not None
-            and isinstance(bid, (int, float))
-            and isinstance(ask, (int, float))
-        ):
-            spreads.append(float(ask) - float(bid))
-    return spreads
+    if not jsonl_path.exists():
+        logger.warning("Snapshot file not found: %s", jsonl_path)
+        return _EMPTY
+
+    arrays = _market_arrays(jsonl_path, market_id)
+    cutoff_ns = time.time_ns() - window_minutes * _NS_PER_MINUTE
+    return arrays.since(cutoff_ns)
 
 
 # ------------------------------------------------------------------
-# Liquidity extraction
+# Result memoisation
 # ------------------------------------------------------------------
-def extract_liquidity(rows: List[Dict[str, Any]]) -> List[float]:
-    """
-    Extract liquidity series: open_interest if present, else volume.
-    Skips rows where neither field is available.
-    """
-    values: List[float] = []
-    for row in rows:
-        oi = row.get("open_interest")
-        if oi is not None and isinstance(oi, (int, float)):
-            values.append(float(oi))
-        else:
-            vol = row.get("volume")
-            if vol is not None and isinstance(vol, (int, float)):
-                values.append(float(vol))
-    return values
+ComputeFn = Callable[[str, int], Any]
+
+
+def cache_by_file_version(
+    compute: ComputeFn,
+    maxsize: int = _RESULT_CACHE_SIZE,
+) -> Callable[[Path, str, int], Any]:
+    """
+    Memoise ``compute(market_id, window_minutes)`` with ``functools.lru_cache``.
+
+    The cache key adds the snapshot file's identity (path, mtime, size)
+    and a wall-clock bucket, so any write to the file invalidates every
+    cached result.  Returns ``run(jsonl_path, market_id, window_minutes)``;
+    results are shared and must be treated as immutable by callers.
+    """
+
+    @functools.lru_cache(maxsize=maxsize)
+    def cached(
+        market_id: str,
+        window_minutes: int,
+        path: str,
+        mtime_ns: int,
+        size: int,
+        bucket: int,
+    ) -> Any:
+        # Everything after window_minutes only participates in the key
+        return compute(market_id, window_minutes)
+
+    def run(jsonl_path: Path, market_id: str, window_minutes: int) -> Any:
+        try:
+            st = jsonl_path.stat()
+        except OSError:
+            return compute(market_id, window_minutes)
+        return cached(
+            market_id,
+            window_minutes,
+            str(jsonl_path),
+            st.st_mtime_ns,
+            st.st_size,
+            int(time.time() // _RESULT_TTL_SEC),
+        )
+
+    run.cache_info = cached.cache_info  # type: ignore[attr-defined]
+    run.cache_clear = cached.cache_clear  # type: ignore[attr-defined]
+    return run
@@ -4,7 +4,7 @@ Liquidity Spike Tool
 Detect liquidity spikes from stored JSONL snapshots.
 
 Reads  : outputs/market_snapshots.jsonl
-Writes : nothing (pure read-only computation)
+Writes : outputs/market_snapshots.idx (row-offset index cache, rebuilt if stale)
 APIs   : none
 Random : none
 
@@ -15,7 +15,6 @@ Outputs a 4-element vector:
 from __future__ import annotations
 
 import logging
-import statistics
 from pathlib import Path
 from typing import Any, Optional
 
@@ -23,12 +22,21 @@ from schemas import EventInput, ToolOutput
 from tools.base_tool import BaseTool
 from tools._snapshot_helpers import (
     DEFAULT_JSONL,
-    extract_liquidity,
-    load_rows,
+    cache_by_file_version,
+    load_market,
 )
 
 logger = logging.getLogger(__name__)
 
+# Plain literals: the registry reads these from source without importing
+# this module (see tools.registry.LazyTool)
+TOOL_NAME = "liquidity_spike_tool"
+TOOL_DESCRIPTION = (
+    "Computes mean liquidity, std liquidity, latest-vs-mean ratio, "
+    "and z-score of latest observation from local market snapshots. "
+    "Deterministic numeric feature vector for agent weighting."
+)
+
 _MIN_SAMPLES = 5
 _VECTOR_LEN = 4
 
@@ -47,28 +55,29 @@ class LiquiditySpikeTool(BaseTool):
 
     def __init__(self, jsonl_path: Optional[Path] = None) -> None:
         self._jsonl_path = jsonl_path or DEFAULT_JSONL
+        self._run_cached = cache_by_file_version(self._compute)
 
     # ------------------------------------------------------------------
     # BaseTool interface
     # ------------------------------------------------------------------
     @property
     def name(self) -> str:
-        return "liquidity_spike_tool"
+        return TOOL_NAME
 
     @property
     def description(self) -> str:
-        return (
-            "Computes mean liquidity, std liquidity, latest-vs-mean ratio, "
-            "and z-score of latest observation from local market snapshots. "
-            "Deterministic numeric feature vector for agent weighting."
-        )
+        return TOOL_DESCRIPTION
 
     def run(self, event: EventInput, **kwargs: Any) -> ToolOutput:
         market_id: str = event.market_id
         window_minutes: int = int(kwargs.get("window_minutes", 120))
 
-        rows = load_rows(self._jsonl_path, market_id, window_minutes)
-        liq_series = extract_liquidity(rows)
+        return self._run_cached(self._jsonl_path, market_id, window_minutes)
+
+    def _compute(self, market_id: str, window_minutes: int) -> ToolOutput:
+        """Load the window for *market_id* and build the feature vector."""
+        market = load_market(self._jsonl_path, market_id, window_minutes)
+        liq_series = market.liquidity_values()
         sample_count = len(liq_series)
 
         if sample_count < _MIN_SAMPLES:
@@ -82,9 +91,12 @@ class LiquiditySpikeTool(BaseTool):
                 metadata={"confidence": 0.0, "sample_count": sample_count},
             )
 
-        mean_liq = sum(liq_series) / len(liq_series)
-        std_liq = statistics.stdev(liq_series) if len(liq_series) >= 2 else 0.0
-        latest = liq_series[-1]
+        mean_liq = float(liq_series.mean())
+        # A flat series is exactly 0, as statistics.stdev gives; np.std could
+        # otherwise return rounding noise and blow up the z-score.
+        flat = liq_series.max() == liq_series.min()
+        std_liq = 0.0 if flat else float(liq_series.std(ddof=1))
+        latest = float(liq_series[-1])
 
         latest_vs_mean_ratio = (latest / mean_liq) if mean_liq != 0 else 0.0
         zscore_latest = ((latest - mean_liq) / std_liq) if std_liq != 0 else 0.0
@@ -58,8 +58,9 @@ class MockRandomContext(BaseTool):
         )
 
     def run(self, event: EventInput, **kwargs) -> ToolOutput:
-        # Derive a stable seed from event_id
-        seed = int(hashlib.sha256(event.event_id.encode()).hexdigest(), 16) % (2**32)
+        # Derive a stable seed from event_id: the low 32 bits of its SHA-256,
+        # read straight from the last 4 digest bytes (no hex round-trip)
+        seed = int.from_bytes(hashlib.sha256(event.event_id.encode()).digest()[-4:], "big")
         rng = random.Random(seed)
         value = rng.random()
 
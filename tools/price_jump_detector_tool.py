@@ -4,7 +4,7 @@ Price Jump Detector Tool
 Detect and measure price jumps from stored JSONL snapshots.
 
 Reads  : outputs/market_snapshots.jsonl
-Writes : nothing (pure read-only computation)
+Writes : outputs/market_snapshots.idx (row-offset index cache, rebuilt if stale)
 APIs   : none
 Random : none
 
@@ -16,22 +16,85 @@ from __future__ import annotations
 
 import logging
 from pathlib import Path
-from typing import Any, List, Optional
+from typing import Any, Callable, Optional, Tuple
+
+import numpy as np
 
 from schemas import EventInput, ToolOutput
 from tools.base_tool import BaseTool
 from tools._snapshot_helpers import (
     DEFAULT_JSONL,
-    extract_prices,
-    load_rows,
+    cache_by_file_version,
+    load_market,
 )
 
 logger = logging.getLogger(__name__)
 
+# Plain literals: the registry reads these from source without importing
+# this module (see tools.registry.LazyTool)
+TOOL_NAME = "price_jump_detector_tool"
+TOOL_DESCRIPTION = (
+    "Detects price jumps and computes max jump, mean jump, "
+    "jump count (>|0.05|), and jump density from local market "
+    "snapshots. Deterministic numeric feature vector for agent weighting."
+)
+
 _MIN_SAMPLES = 5
 _VECTOR_LEN = 4
 _JUMP_THRESHOLD = 0.05
 
+# (max_jump, mean_jump, jump_count) over consecutive price steps
+_JumpStats = Tuple[float, float, int]
+
+
+def _jump_stats(prices: np.ndarray) -> _JumpStats:
+    """
+    Max, mean and threshold count of |prices[i] - prices[i-1]| in a single
+    pass, without the diff/abs temporaries.  Only used when Numba is
+    available.
+    """
+    max_jump = 0.0
+    total = 0.0
+    count = 0
+    for i in range(1, prices.shape[0]):
+        d = abs(prices[i] - prices[i - 1])
+        max_jump = max(max_jump, d)
+        total += d
+        if d > _JUMP_THRESHOLD:
+            count += 1
+    n_steps = prices.shape[0] - 1
+    mean_jump = total / n_steps if n_steps > 0 else 0.0
+    return max_jump, mean_jump, count
+
+
+_jump_kernel: Optional[Callable[[np.ndarray], _JumpStats]] = None
+_kernel_checked = False
+
+
+def _get_kernel() -> Optional[Callable[[np.ndarray], _JumpStats]]:
+    """
+    Return the Numba-compiled :func:`_jump_stats`, or None if Numba is
+    not installed or compilation fails.  Imported lazily for the same
+    reason as in snapshot_volatility_tool: sandbox children import the
+    tools package under a tight address-space limit.
+    """
+    global _jump_kernel, _kernel_checked
+    if not _kernel_checked:
+        _kernel_checked = True
+        try:
+            from numba import njit
+        except ImportError:
+            return None
+        # No cache=True, as in snapshot_volatility_tool (module-name clash)
+        try:
+            kernel = njit(nogil=True)(_jump_stats)
+            kernel(np.array([0.5, 0.52, 0.6], dtype=np.float64))
+        except Exception:  # any compile failure → NumPy path
+            logger.warning("Numba compile of _jump_stats failed; using NumPy", exc_info=True)
+            return None
+        _jump_kernel = kernel
+    return _jump_kernel
+
 
 class PriceJumpDetectorTool(BaseTool):
     """
@@ -45,28 +108,30 @@ class PriceJumpDetectorTool(BaseTool):
 
     def __init__(self, jsonl_path: Optional[Path] = None) -> None:
         self._jsonl_path = jsonl_path or DEFAULT_JSONL
+        self._run_cached = cache_by_file_version(self._compute)
+        _get_kernel()  # pay the JIT cost at construction, not on first run
 
     # ------------------------------------------------------------------
     # BaseTool interface
     # ------------------------------------------------------------------
     @property
     def name(self) -> str:
-        return "price_jump_detector_tool"
+        return TOOL_NAME
 
     @property
     def description(self) -> str:
-        return (
-            "Detects price jumps and computes max jump, mean jump, "
-            "jump count (>|0.05|), and jump density from local market "
-            "snapshots. Deterministic numeric feature vector for agent weighting."
-        )
+        return TOOL_DESCRIPTION
 
     def run(self, event: EventInput, **kwargs: Any) -> ToolOutput:
         market_id: str = event.market_id
         window_minutes: int = int(kwargs.get("window_minutes", 120))
 
-        rows = load_rows(self._jsonl_path, market_id, window_minutes)
-        prices = extract_prices(rows)
+        return self._run_cached(self._jsonl_path, market_id, window_minutes)
+
+    def _compute(self, market_id: str, window_minutes: int) -> ToolOutput:
+        """Load the window for *market_id* and build the feature vector."""
+        market = load_market(self._jsonl_path, market_id, window_minutes)
+        prices = market.prices()
         sample_count = len(prices)
 
         if sample_count < _MIN_SAMPLES:
@@ -80,13 +145,8 @@ class PriceJumpDetectorTool(BaseTool):
                 metadata={"confidence": 0.0, "sample_count": sample_count},
             )
 
-        diffs = self._compute_diffs(prices)
-        abs_diffs = [abs(d) for d in diffs]
-        n_steps = len(diffs)
-
-        max_jump = max(abs_diffs) if abs_diffs else 0.0
-        mean_jump = sum(abs_diffs) / n_steps if n_steps > 0 else 0.0
-        jump_count = sum(1 for d in abs_diffs if d > _JUMP_THRESHOLD)
+        n_steps = sample_count - 1
+        max_jump, mean_jump, jump_count = self._jump_features(prices)
         jump_density = jump_count / n_steps if n_steps > 0 else 0.0
         confidence = min(1.0, sample_count / 50)
 
@@ -112,9 +172,21 @@ class PriceJumpDetectorTool(BaseTool):
         )
 
     # ------------------------------------------------------------------
-    # Internals
+    # Metric computations
     # ------------------------------------------------------------------
     @staticmethod
-    def _compute_diffs(prices: List[float]) -> List[float]:
-        """Consecutive price differences: prices[i+1] - prices[i]."""
-        return [prices[i + 1] - prices[i] for i in range(len(prices) - 1)]
+    def _jump_features(prices: np.ndarray) -> _JumpStats:
+        """Jump statistics, via the compiled kernel when Numba is present."""
+        kernel = _get_kernel()
+        if kernel is not None:
+            max_jump, mean_jump, jump_count = kernel(prices)
+            return float(max_jump), float(mean_jump), int(jump_count)
+
+        abs_diffs = np.abs(np.diff(prices))
+        if abs_diffs.size == 0:
+            return 0.0, 0.0, 0
+        return (
+            float(abs_diffs.max()),
+            float(abs_diffs.mean()),
+            int(np.count_nonzero(abs_diffs > _JUMP_THRESHOLD)),
+        )
@@ -10,16 +10,108 @@ load_approved_generated_tools() using the approved.json manifest.
 
 from __future__ import annotations
 
+import ast
+import importlib
 import importlib.util
 import json
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List
+from typing import Any, Dict, List, Optional, Tuple
 
+from schemas import EventInput, ToolOutput
 from tools.base_tool import BaseTool
 
 logger = logging.getLogger(__name__)
 
+# Generated-tool imports are I/O and compile bound; more threads than this
+# only add contention on the import lock.
+_LOAD_WORKERS_MAX = 8
+
+# Snapshot tools registered as LazyTool ("module:Class").  Each module
+# defines TOOL_NAME and TOOL_DESCRIPTION literals that its class returns.
+_LAZY_SNAPSHOT_TOOLS: List[str] = [
+    "tools.snapshot_volatility_tool:SnapshotVolatilityTool",
+    "tools.spread_compression_tool:SpreadCompressionTool",
+    "tools.price_jump_detector_tool:PriceJumpDetectorTool",
+    "tools.liquidity_spike_tool:LiquiditySpikeTool",
+]
+
+_TOOL_CONSTANTS = ("TOOL_NAME", "TOOL_DESCRIPTION")
+
+
+def _read_tool_constants(module_name: str) -> Tuple[str, str]:
+    """
+    Read a tool module's TOOL_NAME / TOOL_DESCRIPTION literals from its
+    source without importing (or executing) the module.
+    """
+    spec = importlib.util.find_spec(module_name)
+    if spec is None or spec.origin is None:
+        raise ImportError(f"Cannot locate tool module '{module_name}'.")
+    tree = ast.parse(Path(spec.origin).read_text(encoding="utf-8"))
+    found: Dict[str, str] = {}
+    for node in tree.body:
+        if (
+            isinstance(node, ast.Assign)
+            and len(node.targets) == 1
+            and isinstance(node.targets[0], ast.Name)
+            and node.targets[0].id in _TOOL_CONSTANTS
+        ):
+            found[node.targets[0].id] = ast.literal_eval(node.value)
+    missing = [c for c in _TOOL_CONSTANTS if not isinstance(found.get(c), str)]
+    if missing:
+        raise ValueError(
+            f"Tool module '{module_name}' does not define {missing} as string literals."
+        )
+    return found["TOOL_NAME"], found["TOOL_DESCRIPTION"]
+
+
+class LazyTool(BaseTool):
+    """
+    Registry stand-in that imports and constructs the real tool on first use.
+
+    name and description are read from the module's TOOL_NAME /
+    TOOL_DESCRIPTION literals, so listing tools for the agent prompt
+    never imports the tool module.  Anything else (run(), attributes
+    such as ``deterministic``) is forwarded to the real tool, which is built
+    once on first access.
+    """
+
+    def __init__(self, target: str) -> None:
+        self._target = target  # "package.module:ClassName"
+        self._name, self._description = _read_tool_constants(target.partition(":")[0])
+        self._tool: Optional[BaseTool] = None
+
+    @property
+    def name(self) -> str:
+        return self._name
+
+    @property
+    def description(self) -> str:
+        return self._description
+
+    @property
+    def tool(self) -> BaseTool:
+        """The real tool, imported and constructed on first access."""
+        if self._tool is None:
+            module_name, _, class_name = self._target.partition(":")
+            tool = getattr(importlib.import_module(module_name), class_name)()
+            if tool.name != self._name:
+                raise ValueError(
+                    f"Lazy tool '{self._name}' resolved to '{tool.name}' ({self._target})."
+                )
+            self._tool = tool
+        return self._tool
+
+    def run(self, event: EventInput, **kwargs: Any) -> ToolOutput:
+        return self.tool.run(event, **kwargs)
+
+    def __getattr__(self, attr: str) -> Any:
+        # Only reached for attributes LazyTool itself does not define
+        if attr.startswith("__") or attr in ("_target", "_name", "_description", "_tool"):
+            raise AttributeError(attr)
+        return getattr(self.tool, attr)
+
 
 class ToolRegistry:
     """Holds all registered tools. Agent queries this to know what's available."""
@@ -27,12 +119,16 @@ class ToolRegistry:
     def __init__(self):
         self._tools: Dict[str, BaseTool] = {}
         self._generated_tools: Dict[str, str] = {}  # name -> version
+        # Built on first read, dropped on every registration
+        self._cached_list: Optional[List[Dict[str, str]]] = None
+        self._cached_names: Optional[List[str]] = None
 
     def register(self, tool: BaseTool) -> None:
         """Register a tool. Raises if duplicate name."""
         if tool.name in self._tools:
             raise ValueError(f"Tool '{tool.name}' already registered.")
         self._tools[tool.name] = tool
+        self._invalidate_views()
         logger.info("Registered tool: %s", tool.name)
 
     def get(self, name: str) -> BaseTool:
@@ -44,15 +140,29 @@ class ToolRegistry:
         return self._tools[name]
 
     def list_tools(self) -> List[Dict[str, str]]:
-        """Return tool metadata for the agent prompt."""
-        return [
-            {"name": t.name, "description": t.description}
-            for t in self._tools.values()
-        ]
+        """
+        Return tool metadata for the agent prompt.
+
+        The list is cached until the next registration; callers must not
+        modify it.
+        """
+        if self._cached_list is None:
+            self._cached_list = [
+                {"name": t.name, "description": t.description}
+                for t in self._tools.values()
+            ]
+        return self._cached_list
 
     @property
     def tool_names(self) -> List[str]:
-        return list(self._tools.keys())
+        """Registered tool names (cached; must not be modified)."""
+        if self._cached_names is None:
+            self._cached_names = list(self._tools.keys())
+        return self._cached_names
+
+    def _invalidate_views(self) -> None:
+        self._cached_list = None
+        self._cached_names = None
 
     def __contains__(self, name: str) -> bool:
         return name in self._tools
@@ -76,6 +186,7 @@ class ToolRegistry:
             )
         self._tools[tool.name] = tool
         self._generated_tools[tool.name] = version
+        self._invalidate_views()
         logger.info("Registered generated tool: %s v%s", tool.name, version)
 
     def load_approved_generated_tools(self) -> None:
@@ -84,6 +195,10 @@ class ToolRegistry:
 
         For each entry in the manifest, dynamically import the module,
         find the BaseTool subclass, instantiate, and register.
+
+        Module imports run concurrently on a thread pool (file reads and
+        bytecode compilation overlap); registration happens afterwards in
+        manifest order so results are identical to a serial load.
         """
         from config import GENERATED_TOOLS_DIR
 
@@ -101,6 +216,7 @@ class ToolRegistry:
             logger.warning("approved.json must be a JSON array.")
             return
 
+        entries: List[Tuple[str, str, Path]] = []
         for entry in manifest:
             tool_name = entry.get("tool_name", "") if isinstance(entry, dict) else ""
             version = entry.get("version", "0.1.0") if isinstance(entry, dict) else "0.1.0"
@@ -113,8 +229,19 @@ class ToolRegistry:
                 logger.warning("Approved tool file missing: %s", tool_path)
                 continue
 
+            entries.append((tool_name, version, tool_path))
+
+        if not entries:
+            return
+
+        workers = min(len(entries), _LOAD_WORKERS_MAX)
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            loaded = list(pool.map(_try_load_tool_class, entries))
+
+        for (tool_name, version, _), (tool_class, error) in zip(entries, loaded):
             try:
-                tool_class = _load_tool_class(tool_path, tool_name)
+                if error is not None:
+                    raise error
                 if tool_class is not None:
                     self.register_generated_tool(tool_class(), version=version)
             except Exception as exc:
@@ -126,6 +253,17 @@ class ToolRegistry:
         return list(self._generated_tools.keys())
 
 
+def _try_load_tool_class(
+    entry: Tuple[str, str, Path],
+) -> Tuple[Optional[type], Optional[Exception]]:
+    """Thread-pool worker: load one manifest entry, capturing any error."""
+    tool_name, _, tool_path = entry
+    try:
+        return _load_tool_class(tool_path, tool_name), None
+    except Exception as exc:
+        return None, exc
+
+
 def _load_tool_class(tool_path: Path, tool_name: str):
     """
     Dynamically import a tool module and return the BaseTool subclass.
@@ -156,10 +294,6 @@ def _load_tool_class(tool_path: Path, tool_name: str):
 def build_default_registry() -> ToolRegistry:
     """Create and populate the registry with all available tools."""
     from tools.mock_tools import MockPriceSignal, MockRandomContext
-    from tools.snapshot_volatility_tool import SnapshotVolatilityTool
-    from tools.spread_compression_tool import SpreadCompressionTool
-    from tools.price_jump_detector_tool import PriceJumpDetectorTool
-    from tools.liquidity_spike_tool import LiquiditySpikeTool
 
     # External fundamentals layer (Layer B)
     from prediction_agent.tools.external.fred_macro_tool import FredMacroTool
@@ -183,10 +317,9 @@ def build_default_registry() -> ToolRegistry:
     # mock_random_context is pure noise — only register when mocks enabled
     if ENABLE_MOCK_TOOLS:
         registry.register(MockRandomContext())
-    registry.register(SnapshotVolatilityTool())
-    registry.register(SpreadCompressionTool())
-    registry.register(PriceJumpDetectorTool())
-    registry.register(LiquiditySpikeTool())
+    # Snapshot tools are imported and built (JIT kernels included) on first run
+    for target in _LAZY_SNAPSHOT_TOOLS:
+        registry.register(LazyTool(target))
 
     # ── Layer B: External fundamentals ────────────────────────────────────────
     registry.register(FredMacroTool())
@@ -4,7 +4,7 @@ Snapshot Volatility Tool
 Compute deterministic market behavior metrics from stored JSONL snapshots.
 
 Reads  : outputs/market_snapshots.jsonl
-Writes : nothing (pure read-only computation)
+Writes : outputs/market_snapshots.idx (row-offset index cache, rebuilt if stale)
 APIs   : none
 Random : none
 
@@ -14,24 +14,133 @@ Outputs a 5-element vector:
 
 from __future__ import annotations
 
-import json
 import logging
-import statistics
-from datetime import datetime, timezone
+import math
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Optional, Tuple
+
+import numpy as np
 
 from schemas import EventInput, ToolOutput
 from tools.base_tool import BaseTool
+from tools._snapshot_helpers import (
+    DEFAULT_JSONL,
+    MarketArrays,
+    cache_by_file_version,
+    load_market,
+)
 
 logger = logging.getLogger(__name__)
 
-# Default path relative to package root
-_DEFAULT_JSONL = Path(__file__).resolve().parent.parent / "outputs" / "market_snapshots.jsonl"
+# Plain literals: the registry reads these from source without importing
+# this module (see tools.registry.LazyTool)
+TOOL_NAME = "snapshot_volatility_tool"
+TOOL_DESCRIPTION = (
+    "Computes volatility, price range, mean spread, jump rate, "
+    "and liquidity proxy from local market snapshots. "
+    "Deterministic numeric feature vector for agent weighting."
+)
 
 # Minimum data points required for meaningful computation
 _MIN_SAMPLES = 3
 
+# Absolute consecutive price change counted as a jump
+_JUMP_THRESHOLD = 0.05
+
+# (sample_count, volatility, price_range, mean_spread, jump_rate, liquidity_proxy)
+_Features = Tuple[int, float, float, float, float, float]
+
+
+def _fused_features(
+    price: np.ndarray,
+    bid: np.ndarray,
+    ask: np.ndarray,
+    liquidity: np.ndarray,
+) -> _Features:
+    """
+    All five metrics in a single pass over a market window's raw columns
+    (NaN = missing).  Variance uses Welford's update, so no temporary
+    arrays are built.  Only used when Numba is available.
+    """
+    n = 0
+    mean = 0.0
+    m2 = 0.0
+    lo = math.inf
+    hi = -math.inf
+    prev = 0.0
+    jumps = 0
+    spread_sum = 0.0
+    n_spread = 0
+    liq_sum = 0.0
+    n_liq = 0
+
+    for i in range(price.shape[0]):
+        p = price[i]
+        if not math.isnan(p):
+            if n > 0 and abs(p - prev) > _JUMP_THRESHOLD:
+                jumps += 1
+            n += 1
+            delta = p - mean
+            mean += delta / n
+            m2 += delta * (p - mean)
+            lo = min(lo, p)
+            hi = max(hi, p)
+            prev = p
+
+        b = bid[i]
+        a = ask[i]
+        if not (math.isnan(b) or math.isnan(a)):
+            spread_sum += a - b
+            n_spread += 1
+
+        q = liquidity[i]
+        if not math.isnan(q):
+            liq_sum += q
+            n_liq += 1
+
+    volatility = math.sqrt(m2 / (n - 1)) if n >= 2 else 0.0
+    price_range = hi - lo if n > 0 else 0.0
+    mean_spread = spread_sum / n_spread if n_spread > 0 else 0.0
+    jump_rate = jumps / (n - 1) if n >= 2 else 0.0
+    liquidity_proxy = liq_sum / n_liq if n_liq > 0 else 0.0
+    return n, volatility, price_range, mean_spread, jump_rate, liquidity_proxy
+
+
+_fused_kernel: Optional[Callable[..., _Features]] = None
+_kernel_checked = False
+
+
+def _get_kernel() -> Optional[Callable[..., _Features]]:
+    """
+    Return the Numba-compiled :func:`_fused_features`, or None if Numba
+    is not installed or compilation fails.  Compiled and warmed on first
+    call.
+
+    Numba is imported here rather than at module level: it reserves a lot
+    of address space, and the tools package is imported by memory-limited
+    sandbox children that never run this tool.
+    """
+    global _fused_kernel, _kernel_checked
+    if not _kernel_checked:
+        _kernel_checked = True
+        try:
+            from numba import njit
+        except ImportError:
+            return None
+        # No cache=True: Numba's on-disk cache records the defining module by
+        # name, and this file is imported both as tools.* and as
+        # prediction_agent.tools.*; a cache written under one breaks the other
+        try:
+            kernel = njit(nogil=True)(_fused_features)
+            dummy = np.array([0.5, 0.52, 0.6], dtype=np.float64)
+            dummy.flags.writeable = False  # specialise for the cached read-only columns
+            kernel(dummy, dummy, dummy, dummy)
+        except Exception:  # any compile failure → NumPy path
+            logger.warning("Numba compile of _fused_features failed; using NumPy", exc_info=True)
+            return None
+        _fused_kernel = kernel
+    return _fused_kernel
+
 
 class SnapshotVolatilityTool(BaseTool):
     """
@@ -44,22 +153,20 @@ class SnapshotVolatilityTool(BaseTool):
     deterministic: bool = True
 
     def __init__(self, jsonl_path: Optional[Path] = None) -> None:
-        self._jsonl_path = jsonl_path or _DEFAULT_JSONL
+        self._jsonl_path = jsonl_path or DEFAULT_JSONL
+        self._run_cached = cache_by_file_version(self._compute)
+        _get_kernel()  # pay the JIT cost at construction, not on first run
 
     # ------------------------------------------------------------------
     # BaseTool interface
     # ------------------------------------------------------------------
     @property
     def name(self) -> str:
-        return "snapshot_volatility_tool"
+        return TOOL_NAME
 
     @property
     def description(self) -> str:
-        return (
-            "Computes volatility, price range, mean spread, jump rate, "
-            "and liquidity proxy from local market snapshots. "
-            "Deterministic numeric feature vector for agent weighting."
-        )
+        return TOOL_DESCRIPTION
 
     def run(self, event: EventInput, **kwargs: Any) -> ToolOutput:
         """
@@ -72,9 +179,19 @@ class SnapshotVolatilityTool(BaseTool):
         market_id: str = event.market_id
         window_minutes: int = int(kwargs.get("window_minutes", 120))
 
-        rows = self._load_rows(market_id, window_minutes)
-        prices = self._extract_prices(rows)
-        sample_count = len(prices)
+        return self._run_cached(self._jsonl_path, market_id, window_minutes)
+
+    def _compute(self, market_id: str, window_minutes: int) -> ToolOutput:
+        """Load the window for *market_id* and build the feature vector."""
+        market = load_market(self._jsonl_path, market_id, window_minutes)
+        (
+            sample_count,
+            volatility,
+            price_range,
+            mean_spread,
+            jump_rate,
+            liquidity_proxy,
+        ) = self._features(market)
 
         if sample_count < _MIN_SAMPLES:
             logger.info(
@@ -88,11 +205,6 @@ class SnapshotVolatilityTool(BaseTool):
                 metadata={"confidence": 0.0, "sample_count": sample_count},
             )
 
-        volatility = self._compute_volatility(prices)
-        price_range = self._compute_price_range(prices)
-        mean_spread = self._compute_mean_spread(rows)
-        jump_rate = self._compute_jump_rate(prices)
-        liquidity_proxy = self._compute_liquidity_proxy(rows)
         confidence = min(1.0, sample_count / 50)
 
         output_vector = [
@@ -121,166 +233,60 @@ class SnapshotVolatilityTool(BaseTool):
         )
 
     # ------------------------------------------------------------------
-    # Data loading
-    # ------------------------------------------------------------------
-    def _load_rows(self, market_id: str, window_minutes: int) -> List[Dict[str, Any]]:
-        """Read JSONL and return rows matching market_id within the time window."""
-        if not self._jsonl_path.exists():
-            logger.warning("Snapshot file not found: %s", self._jsonl_path)
-            return []
-
-        now = datetime.now(timezone.utc)
-        cutoff_seconds = window_minutes * 60
-        matched: List[Dict[str, Any]] = []
-
-        with open(self._jsonl_path, "r", encoding="utf-8") as fh:
-            for line_num, raw_line in enumerate(fh, start=1):
-                raw_line = raw_line.strip()
-                if not raw_line:
-                    continue
-                try:
-                    row = json.loads(raw_line)
-                except json.JSONDecodeError:
-                    logger.debug("Skipping malformed JSON on line %d", line_num)
-                    continue
-
-                if row.get("market_id") != market_id:
-                    continue
-
-                # Parse timestamp
-                ts = self._parse_timestamp(row.get("timestamp"))
-                if ts is None:
-                    continue
-
-                # Window filter
-                age_seconds = (now - ts).total_seconds()
-                if age_seconds > cutoff_seconds:
-                    continue
-
-                row["_parsed_ts"] = ts
-                matched.append(row)
-
-        # Sort by timestamp ascending
-        matched.sort(key=lambda r: r["_parsed_ts"])
-        return matched
-
-    # ------------------------------------------------------------------
-    # Price extraction (PRICE RULE)
+    # Metric computations
     # ------------------------------------------------------------------
-    @staticmethod
-    def _extract_prices(rows: List[Dict[str, Any]]) -> List[float]:
-        """
-        Extract price series.
-        Priority: last_price > midpoint(yes_bid, yes_ask) > skip.
-        """
-        prices: List[float] = []
-        for row in rows:
-            price = SnapshotVolatilityTool._row_price(row)
-            if price is not None:
-                prices.append(price)
-        return prices
+    @classmethod
+    def _features(cls, market: MarketArrays) -> _Features:
+        """Compute all metrics, via the fused kernel when Numba is present."""
+        kernel = _get_kernel()
+        if kernel is not None:
+            n, *metrics = kernel(
+                market.price, market.bid, market.ask, market.liquidity
+            )
+            return (int(n), *(float(m) for m in metrics))
 
-    @staticmethod
-    def _row_price(row: Dict[str, Any]) -> Optional[float]:
-        """Return usable price for a single row, or None."""
-        lp = row.get("last_price")
-        if lp is not None and isinstance(lp, (int, float)) and lp > 0:
-            return float(lp)
-
-        bid = row.get("yes_bid")
-        ask = row.get("yes_ask")
-        if (
-            bid is not None
-            and ask is not None
-            and isinstance(bid, (int, float))
-            and isinstance(ask, (int, float))
-            and (bid > 0 or ask > 0)
-        ):
-            return (float(bid) + float(ask)) / 2.0
-
-        return None
+        prices = market.prices()
+        return (
+            int(prices.size),
+            cls._compute_volatility(prices),
+            cls._compute_price_range(prices),
+            cls._compute_mean_spread(market.spreads()),
+            cls._compute_jump_rate(prices),
+            cls._compute_liquidity_proxy(market.liquidity_values()),
+        )
 
-    # ------------------------------------------------------------------
-    # Metric computations
-    # ------------------------------------------------------------------
     @staticmethod
-    def _compute_volatility(prices: List[float]) -> float:
-        """Standard deviation of price series."""
-        if len(prices) < 2:
+    def _compute_volatility(prices: np.ndarray) -> float:
+        """Sample standard deviation of price series."""
+        if prices.size < 2:
             return 0.0
-        return statistics.stdev(prices)
+        return float(np.std(prices, ddof=1))
 
     @staticmethod
-    def _compute_price_range(prices: List[float]) -> float:
+    def _compute_price_range(prices: np.ndarray) -> float:
         """max(price) - min(price)."""
-        if not prices:
+        if prices.size == 0:
             return 0.0
-        return max(prices) - min(prices)
+        return float(np.ptp(prices))
 
     @staticmethod
-    def _compute_mean_spread(rows: List[Dict[str, Any]]) -> float:
+    def _compute_mean_spread(spreads: np.ndarray) -> float:
         """Average of (yes_ask - yes_bid) across rows where both exist."""
-        spreads: List[float] = []
-        for row in rows:
-            bid = row.get("yes_bid")
-            ask = row.get("yes_ask")
-            if (
-                bid is not None
-                and ask is not None
-                and isinstance(bid, (int, float))
-                and isinstance(ask, (int, float))
-            ):
-                spreads.append(float(ask) - float(bid))
-        if not spreads:
+        if spreads.size == 0:
             return 0.0
-        return sum(spreads) / len(spreads)
+        return float(spreads.mean())
 
     @staticmethod
-    def _compute_jump_rate(prices: List[float]) -> float:
+    def _compute_jump_rate(prices: np.ndarray) -> float:
         """Fraction of consecutive price changes > 0.05."""
-        if len(prices) < 2:
+        if prices.size < 2:
             return 0.0
-        jumps = 0
-        pairs = len(prices) - 1
-        for i in range(pairs):
-            if abs(prices[i + 1] - prices[i]) > 0.05:
-                jumps += 1
-        return jumps / pairs
+        jumps = np.count_nonzero(np.abs(np.diff(prices)) > _JUMP_THRESHOLD)
+        return jumps / (prices.size - 1)
 
     @staticmethod
-    def _compute_liquidity_proxy(rows: List[Dict[str, Any]]) -> float:
+    def _compute_liquidity_proxy(values: np.ndarray) -> float:
         """Mean of open_interest (if present) else volume."""
-        values: List[float] = []
-        for row in rows:
-            oi = row.get("open_interest")
-            if oi is not None and isinstance(oi, (int, float)):
-                values.append(float(oi))
-            else:
-                vol = row.get("volume")
-                if vol is not None and isinstance(vol, (int, float)):
-                    values.append(float(vol))
-        if not values:
+        if values.size == 0:
             return 0.0
-        return sum(values) / len(values)
-
-    # ------------------------------------------------------------------
-    # Helpers
-    # ------------------------------------------------------------------
-    @staticmethod
-    def _parse_timestamp(raw: Any) -> Optional[datetime]:
-        """Parse an ISO-8601 timestamp string into a timezone-aware datetime."""
-        if raw is None:
-            return None
-        if isinstance(raw, datetime):
-            if raw.tzinfo is None:
-                return raw.replace(tzinfo=timezone.utc)
-            return raw
-        if not isinstance(raw, str):
-            return None
-        try:
-            dt = datetime.fromisoformat(raw)
-            if dt.tzinfo is None:
-                dt = dt.replace(tzinfo=timezone.utc)
-            return dt
-        except (ValueError, TypeError):
-            return None
+        return float(values.mean())
@@ -4,7 +4,7 @@ Spread Compression Tool
 Compute bid-ask spread behaviour metrics from stored JSONL snapshots.
 
 Reads  : outputs/market_snapshots.jsonl
-Writes : nothing (pure read-only computation)
+Writes : outputs/market_snapshots.idx (row-offset index cache, rebuilt if stale)
 APIs   : none
 Random : none
 
@@ -15,7 +15,6 @@ Outputs a 4-element vector:
 from __future__ import annotations
 
 import logging
-import statistics
 from pathlib import Path
 from typing import Any, Optional
 
@@ -23,12 +22,21 @@ from schemas import EventInput, ToolOutput
 from tools.base_tool import BaseTool
 from tools._snapshot_helpers import (
     DEFAULT_JSONL,
-    extract_spreads,
-    load_rows,
+    cache_by_file_version,
+    load_market,
 )
 
 logger = logging.getLogger(__name__)
 
+# Plain literals: the registry reads these from source without importing
+# this module (see tools.registry.LazyTool)
+TOOL_NAME = "spread_compression_tool"
+TOOL_DESCRIPTION = (
+    "Computes mean spread, spread std-dev, spread trend, and "
+    "compression ratio from local market snapshots. "
+    "Deterministic numeric feature vector for agent weighting."
+)
+
 _MIN_SAMPLES = 3
 _VECTOR_LEN = 4
 
@@ -45,28 +53,29 @@ class SpreadCompressionTool(BaseTool):
 
     def __init__(self, jsonl_path: Optional[Path] = None) -> None:
         self._jsonl_path = jsonl_path or DEFAULT_JSONL
+        self._run_cached = cache_by_file_version(self._compute)
 
     # ------------------------------------------------------------------
     # BaseTool interface
     # ------------------------------------------------------------------
     @property
     def name(self) -> str:
-        return "spread_compression_tool"
+        return TOOL_NAME
 
     @property
     def description(self) -> str:
-        return (
-            "Computes mean spread, spread std-dev, spread trend, and "
-            "compression ratio from local market snapshots. "
-            "Deterministic numeric feature vector for agent weighting."
-        )
+        return TOOL_DESCRIPTION
 
     def run(self, event: EventInput, **kwargs: Any) -> ToolOutput:
         market_id: str = event.market_id
         window_minutes: int = int(kwargs.get("window_minutes", 120))
 
-        rows = load_rows(self._jsonl_path, market_id, window_minutes)
-        spreads = extract_spreads(rows)
+        return self._run_cached(self._jsonl_path, market_id, window_minutes)
+
+    def _compute(self, market_id: str, window_minutes: int) -> ToolOutput:
+        """Load the window for *market_id* and build the feature vector."""
+        market = load_market(self._jsonl_path, market_id, window_minutes)
+        spreads = market.spreads()
         sample_count = len(spreads)
 
         if sample_count < _MIN_SAMPLES:
@@ -80,10 +89,10 @@ class SpreadCompressionTool(BaseTool):
                 metadata={"confidence": 0.0, "sample_count": sample_count},
             )
 
-        mean_spread = sum(spreads) / len(spreads)
-        spread_std = statistics.stdev(spreads) if len(spreads) >= 2 else 0.0
-        spread_trend = spreads[-1] - spreads[0]
-        compression_ratio = (spreads[-1] / mean_spread) if mean_spread != 0 else 0.0
+        mean_spread = float(spreads.mean())
+        spread_std = float(spreads.std(ddof=1))
+        spread_trend = float(spreads[-1] - spreads[0])
+        compression_ratio = (float(spreads[-1]) / mean_spread) if mean_spread != 0 else 0.0
         confidence = min(1.0, sample_count / 50)
 
         output_vector = [